@@ -5,8 +5,8 @@ from pathlib import Path
 # Add src to sys.path so we can import from src.*
 sys.path.append(str(Path(__file__).parent))
 
-from src.application.data_pipeline.fetcher import fetch_data
-from src.application.data_pipeline.processor import process_data
+from src.application.data_pipeline.dataset_cache import dataset_cache
+from src.application.data_pipeline.jobs import refresh_jobs
 
 # side bar navigation
 st.set_page_config(page_title='Smart Tasking', layout='wide')
@@ -25,23 +25,51 @@ pages = {
     ],
 }
 
-def refresh_data() -> None:
-    """Run the new data refresh pipeline."""
-    try:
-        fetch_data()
-        process_data()
-        st.cache_data.clear()
-        st.success("Data refreshed successfully. Reloading dashboard...")
-        st.rerun()
-    except Exception as e:
-        st.error(f"Failed to refresh data: {e}")
+def refresh_data(full_resync: bool = False) -> None:
+    """Start the new data refresh pipeline on the background worker."""
+    st.session_state["refresh_job_id"] = refresh_jobs.submit(full_resync=full_resync)
 
 
-refresh_col, _ = st.columns([1, 6])
+@st.fragment(run_every=1)
+def refresh_status() -> None:
+    """Poll the running refresh; once it is done, reload every page on the new data."""
+    job = refresh_jobs.get(st.session_state["refresh_job_id"])
+    if job is None:
+        del st.session_state["refresh_job_id"]
+        return
+    if not job.finished:
+        st.progress(job.progress, text=f"Refreshing data: {job.stage or 'queued'}...")
+        return
+
+    del st.session_state["refresh_job_id"]
+    if job.error:
+        st.error(f"Failed to refresh data: {job.error}")
+        return
+    # Only the task datasets (and those derived from them) are reloaded; other caches stay warm
+    dataset_cache.invalidate("tasks")
+    st.toast("Data refreshed successfully.")
+    st.rerun(scope="app")
+
+
+refreshing = "refresh_job_id" in st.session_state
+refresh_col, resync_col, _ = st.columns([1, 1, 5])
 with refresh_col:
-    if st.button("🔄 Refresh Data", help="Fetch latest Trello data and reprocess datasets"):
-        with st.spinner("Refreshing data..."):
-            refresh_data()
+    st.button(
+        "🔄 Refresh Data",
+        help="Fetch Trello changes since the last sync and reprocess datasets",
+        on_click=refresh_data,
+        disabled=refreshing,
+    )
+with resync_col:
+    st.button(
+        "⟳ Full Resync",
+        help="Re-download every card, list and action from Trello",
+        on_click=refresh_data,
+        kwargs={"full_resync": True},
+        disabled=refreshing,
+    )
+if refreshing:
+    refresh_status()
 
 pg = st.navigation(pages, position='top')
 pg.run()
@@ -0,0 +1,69 @@
+"""Reduce a synthetic board history to first done moves, page by page.
+
+Run from the project root:
+    python -m benchmarks.bench_action_pages
+
+Each board touches one distinct card per ten actions, so the reduced result
+grows with the board. Time should grow linearly with the number of actions,
+and peak RSS with the number of cards plus one page rather than with the full
+history. Sizes run smallest first, since ru_maxrss is the process high-water mark.
+"""
+import resource
+import sys
+import time
+
+import pandas as pd
+
+from src.application.data_pipeline.fetcher import ACTIONS_PAGE_LIMIT, first_done_moves, iter_action_pages
+
+BOARD_SIZES = [10_000, 100_000, 300_000, 1_000_000]
+ACTIONS_PER_CARD = 10
+START = pd.Timestamp("2020-01-01", tz="UTC")
+
+
+def synthetic_board(total_actions: int):
+    """Return a `fetch_page` stand-in serving `total_actions` list moves, newest first."""
+    total_cards = max(total_actions // ACTIONS_PER_CARD, 1)
+
+    def fetch_page(before=None, since=None, limit=ACTIONS_PAGE_LIMIT):
+        start = total_actions if before is None else int(before)
+        stop = max(start - limit, 0)
+        return [
+            {
+                "id": str(i),
+                "type": "updateCard",
+                "date": (START + pd.Timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "data": {
+                    "card": {"id": f"card-{i % total_cards}"},
+                    "listBefore": {"name": "Doing"},
+                    "listAfter": {"name": "Done"},
+                },
+            }
+            for i in range(start - 1, stop - 1, -1)
+        ]
+
+    return fetch_page
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run(total_actions: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    moves = first_done_moves(iter_action_pages(fetch_page=synthetic_board(total_actions)))
+    elapsed = time.perf_counter() - started
+    assert len(moves) == max(total_actions // ACTIONS_PER_CARD, 1)
+    return elapsed, len(moves)
+
+
+if __name__ == "__main__":
+    print(f"baseline peak RSS {peak_rss_mb():7.1f} MiB")
+    for size in BOARD_SIZES:
+        elapsed, cards = run(size)
+        print(
+            f"{size:>9,} actions  {cards:>7,} cards  {elapsed:7.3f}s  "
+            f"{elapsed / size * 1e6:6.2f}us/action  peak RSS {peak_rss_mb():7.1f} MiB"
+        )
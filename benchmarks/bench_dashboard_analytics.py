@@ -0,0 +1,142 @@
+"""Compare the dashboard's former inline aggregations with slicing the aggregate cubes.
+
+The cube path's time should stay flat as the card history grows.
+
+Run from the project root:
+    python -m benchmarks.bench_dashboard_analytics
+"""
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.core.config import settings
+from src.application.analytics.dashboard import DashboardFilters, build_dashboard_analytics
+from src.application.data_pipeline.cubes import build_cubes
+from src.application.data_pipeline.dataset_cache import DatasetCache
+from src.application.data_pipeline.schema import apply_task_dtypes
+from src.application.data_pipeline.views import add_relative_columns, done_view, pending_view
+
+CARD_COUNTS = [100_000, 1_000_000]
+LISTS = ["Backlog", "Doing", "Review", "Errands", "Reading", "Health"]
+DAY = date(2026, 6, 1)
+REPEATS = 5
+# Open cards stay roughly constant while the completed history grows
+PENDING_CARDS = 5_000
+
+
+def task_frame(total_cards: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    day = pd.Timestamp(DAY, tz="UTC")
+    done = rng.random(total_cards) >= PENDING_CARDS / total_cards
+    origins = np.array(LISTS + ["other"])[rng.integers(0, len(LISTS) + 1, total_cards)]
+    due = day + pd.to_timedelta(rng.integers(-90, 120, total_cards), unit="D")
+    tasks = pd.DataFrame({
+        "list": np.array(LISTS)[rng.integers(0, len(LISTS), total_cards)],
+        "card": [f"task {i}" for i in range(total_cards)],
+        "card_id": [f"card-{i}" for i in range(total_cards)],
+        "card_due": due.where(rng.random(total_cards) < 0.7),
+        "card_last_activity": day - pd.to_timedelta(rng.integers(0, 400, total_cards), unit="D"),
+        "status": np.where(done, "Done", "Not Done"),
+        "done_date": (day - pd.to_timedelta(rng.integers(0, 365 * 24, total_cards), unit="h")).where(done),
+        "origin_list": pd.Series(origins).where(done),
+    })
+    return apply_task_dtypes(add_relative_columns(tasks, DAY))
+
+
+def inline_aggregations(all_df: pd.DataFrame, pending_df: pd.DataFrame, filters: DashboardFilters) -> dict:
+    """The aggregations the dashboard page used to run on every rerun, kept here as the baseline."""
+    done_df = done_view(all_df)
+    filtered_df = all_df.copy()
+    filtered_df = filtered_df[filtered_df["status"].isin(filters.statuses)]
+    filtered_df = filtered_df[filtered_df["list"].isin(filters.lists)]
+    filtered_done_df = done_df.copy()
+    filtered_done_df = filtered_done_df[filtered_done_df["origin_list"].isin(filters.lists)]
+    done_start = pd.Timestamp(filters.done_start, tz="UTC")
+    done_end = pd.Timestamp(filters.done_end, tz="UTC") + pd.Timedelta(days=1)
+    filtered_done_df = filtered_done_df[
+        (filtered_done_df["done_date"] >= done_start) & (filtered_done_df["done_date"] < done_end)
+    ]
+    filtered_pending_df = pending_df.copy()
+    filtered_pending_df = filtered_pending_df[filtered_pending_df["list"].isin(filters.lists)]
+    due_start = pd.Timestamp(filters.due_start, tz="UTC")
+    due_end = pd.Timestamp(filters.due_end, tz="UTC") + pd.Timedelta(days=1)
+    filtered_pending_df = filtered_pending_df[
+        (filtered_pending_df["card_due"] >= due_start) & (filtered_pending_df["card_due"] < due_end)
+    ]
+
+    weekday = filtered_done_df.copy()
+    weekday["weekday"] = weekday["done_date"].dt.day_name()
+    best_day = weekday["weekday"].value_counts().idxmax()
+    task_counts = (
+        filtered_df[filtered_df["status"] == "Not Done"].groupby("list", observed=True).size().reset_index(name="count")
+    )
+    daily = filtered_done_df.groupby(filtered_done_df["done_date"].dt.date).size()
+    daily = daily.reindex(pd.date_range(start=filters.done_start, end=filters.done_end, freq="D").date, fill_value=0)
+    cumulative = daily.values.cumsum()
+    incomplete = filtered_df[filtered_df["status"] == "Not Done"].copy()
+    incomplete["age_category"] = incomplete["card_age"].apply(
+        lambda x: f"Old (>{settings.OLD_TASK_AGE} days)" if x > settings.OLD_TASK_AGE else "New"
+    )
+    oldest = incomplete.sort_values(by="card_age", ascending=False).head(5)
+    calplot_done = filtered_done_df.dropna(subset=["done_date"]).copy()
+    calplot_done["done_date"] = calplot_done["done_date"].astype(str).apply(lambda value: value.split()[0])
+    done_counts = calplot_done["done_date"].value_counts()
+    calplot_due = filtered_pending_df.dropna(subset=["card_due"]).copy()
+    calplot_due["card_due"] = calplot_due["card_due"].astype(str).apply(lambda value: value.split()[0])
+    due_counts = calplot_due["card_due"].value_counts()
+    return {
+        "best_day": best_day,
+        "pending_per_list": task_counts,
+        "cumulative": cumulative,
+        "oldest": oldest,
+        "done_calendar": done_counts,
+        "due_calendar": due_counts,
+    }
+
+
+def timed(func, *args) -> tuple[object, float]:
+    best, result = float("inf"), None
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+if __name__ == "__main__":
+    for total_cards in CARD_COUNTS:
+        tasks = task_frame(total_cards)
+        pending = pending_view(tasks)
+        filters = DashboardFilters(
+            statuses=("Done", "Not Done"),
+            lists=tuple(LISTS),
+            task_query="",
+            done_start=date(2025, 10, 5),
+            done_end=DAY,
+            due_start=date(2026, 3, 1),
+            due_end=date(2026, 9, 30),
+        )
+        done_rows = tasks[tasks["done_date"] >= pd.Timestamp(DAY, tz="UTC")]
+        cubes, build_time = timed(build_cubes, tasks)
+        cache = DatasetCache()
+        cache.register(
+            "dashboard", lambda f: build_dashboard_analytics(cubes, pending, done_rows, f, DAY), version=lambda: 1
+        )
+
+        inline, inline_time = timed(inline_aggregations, tasks, pending, filters)
+        analytics, cube_time = timed(build_dashboard_analytics, cubes, pending, done_rows, filters, DAY)
+        cache.get("dashboard", filters)
+        _, hit_time = timed(cache.get, "dashboard", filters)
+
+        assert inline["best_day"] == analytics.metrics.best_day
+        assert (inline["cumulative"] == analytics.done_progress["Cumulative Tasks"].to_numpy()).all()
+        assert inline["done_calendar"].sum() == analytics.done_calendar["count"].sum()
+        assert inline["due_calendar"].sum() == analytics.due_calendar["count"].sum()
+        assert (inline["pending_per_list"]["count"].to_numpy() == analytics.pending_per_list["count"].to_numpy()).all()
+        print(
+            f"{total_cards:>9,} cards  inline {inline_time * 1000:8.1f} ms  "
+            f"cubes {cube_time * 1000:7.1f} ms ({len(cubes.done) + len(cubes.due):,} rows, "
+            f"built in {build_time * 1000:.0f} ms)  memo hit {hit_time * 1e6:6.1f} us"
+        )
@@ -0,0 +1,103 @@
+"""Compare the per-action loop with the columnar done-transition derivation.
+
+Run from the project root:
+    python -m benchmarks.bench_done_transitions
+"""
+import random
+import time
+
+import pandas as pd
+
+from src.application.data_pipeline.fetcher import (
+    ACTIONS_PAGE_LIMIT,
+    DONE_LIST_NAME,
+    apply_done_transitions,
+    first_done_moves,
+)
+
+ACTION_COUNTS = [100_000, 1_000_000]
+LISTS = ["Backlog", "Doing", "Review", DONE_LIST_NAME]
+
+
+def synthetic_pages(total_actions: int, total_cards: int) -> list[list[dict]]:
+    rng = random.Random(0)
+    start = pd.Timestamp("2020-01-01", tz="UTC")
+    actions = []
+    for i in range(total_actions, 0, -1):
+        before, after = rng.sample(LISTS, 2)
+        actions.append({
+            "id": str(i),
+            "type": "updateCard",
+            "date": (start + pd.Timedelta(minutes=i)).isoformat().replace("+00:00", "Z"),
+            "data": {
+                "card": {"id": f"card-{rng.randrange(total_cards)}"},
+                "listBefore": {"name": before},
+                "listAfter": {"name": after},
+            },
+        })
+    return [actions[i:i + ACTIONS_PAGE_LIMIT] for i in range(0, len(actions), ACTIONS_PAGE_LIMIT)]
+
+
+def task_frame(total_cards: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "list": "Backlog",
+        "card": "task",
+        "card_id": [f"card-{i}" for i in range(total_cards)],
+        "card_due": None,
+        "card_last_activity": None,
+        "status": "Not Done",
+        "done_date": pd.NaT,
+        "origin_list": None,
+    })
+
+
+def loop_derivation(pages: list[list[dict]], data: pd.DataFrame, list_names: set[str]) -> pd.DataFrame:
+    """The original row-by-row implementation, kept here as the baseline."""
+    actions = sorted((action for page in pages for action in page), key=lambda x: x["date"])
+    done_transitions = {}
+    for action in actions:
+        action_data = action.get("data", {})
+        if action.get("type") != "updateCard":
+            continue
+        list_after = action_data.get("listAfter", {}).get("name")
+        list_before = action_data.get("listBefore", {}).get("name")
+        card_id = action_data.get("card", {}).get("id")
+        if list_after == DONE_LIST_NAME and list_before != DONE_LIST_NAME and card_id not in done_transitions:
+            origin_list = list_before if list_before in list_names else "other"
+            done_transitions[card_id] = {"origin_list": origin_list, "done_date": action["date"]}
+
+    done_mask = data["card_id"].isin(done_transitions.keys())
+    data.loc[done_mask, "status"] = "Done"
+    data.loc[done_mask, "done_date"] = data.loc[done_mask, "card_id"].map(
+        lambda x: pd.to_datetime(done_transitions[x]["done_date"]).tz_convert(None)
+    )
+    data.loc[done_mask, "origin_list"] = data.loc[done_mask, "card_id"].map(
+        lambda x: done_transitions[x]["origin_list"]
+    )
+    return data
+
+
+def columnar_derivation(pages: list[list[dict]], data: pd.DataFrame, list_names: set[str]) -> pd.DataFrame:
+    return apply_done_transitions(data, first_done_moves(pages), list_names)
+
+
+def timed(func, *args) -> tuple[pd.DataFrame, float]:
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    list_names = set(LISTS)
+    for total_actions in ACTION_COUNTS:
+        total_cards = total_actions // 10
+        pages = synthetic_pages(total_actions, total_cards)
+        loop_result, loop_time = timed(loop_derivation, pages, task_frame(total_cards), list_names)
+        columnar_result, columnar_time = timed(columnar_derivation, pages, task_frame(total_cards), list_names)
+
+        assert (loop_result["status"] == columnar_result["status"]).all()
+        assert loop_result["done_date"].equals(columnar_result["done_date"].dt.tz_convert(None))
+        print(
+            f"{total_actions:>9,} actions  loop {loop_time:7.2f}s  "
+            f"columnar {columnar_time:7.2f}s  x{loop_time / columnar_time:5.1f}"
+        )
@@ -0,0 +1,37 @@
+"""Time the priority engine on a synthetic pending-task frame.
+
+Run from the project root:
+    python -m benchmarks.bench_priority_engine
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.application.scoring.engine import priority_engine
+
+CARD_COUNTS = [100_000, 1_000_000]
+LISTS = ["Backlog", "Doing", "Review", "Errands", "Reading", "Health"]
+
+
+def pending_frame(total_cards: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    days_to_due = rng.integers(-60, 120, total_cards).astype("float64")
+    days_to_due[rng.random(total_cards) < 0.3] = np.nan
+    return pd.DataFrame({
+        "list": pd.Categorical.from_codes(rng.integers(0, len(LISTS), total_cards), LISTS),
+        "card_age": rng.integers(0, 365, total_cards),
+        "days_to_due": days_to_due,
+        "list_completion_rate": rng.random(len(LISTS))[rng.integers(0, len(LISTS), total_cards)],
+    })
+
+
+if __name__ == "__main__":
+    for total_cards in CARD_COUNTS:
+        tasks = pending_frame(total_cards)
+        priority_engine.score(tasks)
+        started = time.perf_counter()
+        scores = priority_engine.score(tasks)
+        elapsed = time.perf_counter() - started
+        assert np.isfinite(scores).all()
+        print(f"{total_cards:>9,} cards  {elapsed * 1000:8.1f} ms  ({len(priority_engine.scorers)} scorers)")
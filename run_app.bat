@@ -6,13 +6,9 @@ if exist venv\Scripts\activate (
     call venv\Scripts\activate
 )
 
-REM Run fetch script
-echo Fetching Trello data...
-python -m src.application.data_pipeline.fetcher
-
-REM Apply Processing
-echo Processing data...
-python -m src.application.data_pipeline.processor
+REM Fetch and process Trello data
+echo Fetching and processing Trello data...
+python -m src.application.data_pipeline.pipeline
 
 REM Run streamlit app
 echo Starting Streamlit app...
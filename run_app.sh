@@ -7,11 +7,8 @@ if [ -d "venv" ]; then
     source venv/bin/activate
 fi
 
-echo "Fetching Trello data..."
-python3 -m src.application.data_pipeline.fetcher
-
-echo "Processing data..."
-python3 -m src.application.data_pipeline.processor
+echo "Fetching and processing Trello data..."
+python3 -m src.application.data_pipeline.pipeline
 
 echo "Starting Streamlit app..."
 streamlit run app.py
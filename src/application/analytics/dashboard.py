@@ -0,0 +1,388 @@
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.core.config import settings
+from src.application.analytics.resampling import bucket_starts, choose_resolution, minmax_downsample
+from src.application.data_pipeline.cubes import TaskCubes, build_cubes, cubes_version, load_cubes
+from src.application.data_pipeline.dataset_cache import dataset_cache
+from src.application.data_pipeline.views import load_pending, load_tasks, tasks_version
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+WEEK_ORDER = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+STACK_WEEK_ORDER = ["Friday", "Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday"]
+DUE_WORKLOAD_MONTHS = 2
+OLDEST_PENDING_ROWS = 5
+ONE_DAY = np.timedelta64(1, "D")
+DONE_ROW_COLUMNS = ["card", "origin_list", "status", "done_date"]
+
+
+@dataclass(frozen=True)
+class DashboardFilters:
+    """Sidebar selections; hashable, so it can key cached results."""
+
+    statuses: tuple[str, ...]
+    lists: tuple[str, ...]
+    task_query: str
+    done_start: date
+    done_end: date
+    due_start: date
+    due_end: date
+
+
+@dataclass(frozen=True)
+class FilterOptions:
+    statuses: list[str]
+    lists: list[str]
+    done_range: tuple[date, date]
+    due_range: tuple[date, date]
+
+
+@dataclass(frozen=True)
+class DashboardMetrics:
+    total: int
+    completed: int
+    pending: int
+    completion_rate: float
+    best_day: str
+    avg_daily: float
+
+
+@dataclass(frozen=True)
+class DashboardAnalytics:
+    pending_cards: pd.DataFrame
+    metrics: DashboardMetrics
+    pending_per_list: pd.DataFrame
+    done_progress: pd.DataFrame
+    done_resolution: str
+    done_by_origin: pd.DataFrame
+    weekday_done: pd.DataFrame
+    weekday_origin_done: pd.DataFrame
+    done_today: pd.DataFrame
+    oldest_pending: pd.DataFrame
+    done_calendar: pd.DataFrame
+    done_calendar_resolution: str
+    due_calendar: pd.DataFrame
+    due_calendar_resolution: str
+    overdue: pd.DataFrame
+    due_today: pd.DataFrame
+    due_workload: pd.DataFrame
+    due_totals: pd.DataFrame
+    due_workload_resolution: str
+
+
+def data_version() -> tuple:
+    """Version token of everything the dashboard reads: the task table and its cubes."""
+    return tasks_version(), cubes_version()
+
+
+def _day(value: date) -> pd.Timestamp:
+    """Naive midnight of `value`, the day representation used by the cubes."""
+    return pd.Timestamp(value)
+
+
+def _utc_day(day: date) -> pd.Timestamp:
+    return pd.Timestamp(day, tz="UTC")
+
+
+def _done_cutoff() -> pd.Timestamp:
+    # Same cutoff as views.done_view, at day granularity
+    return _day(pd.Timestamp(settings.START_DATE).date())
+
+
+def _date_bounds(values: pd.Series, default: date) -> tuple[date, date]:
+    values = values.dropna()
+    if values.empty:
+        return default, default
+    return values.min().date(), values.max().date()
+
+
+def _name_mask(tasks: pd.DataFrame, task_query: str) -> np.ndarray:
+    return tasks["card"].str.contains(task_query, case=False, regex=False).fillna(False).astype(bool).to_numpy()
+
+
+def filter_options(cubes: TaskCubes, day: date) -> FilterOptions:
+    """Choices and bounds for the sidebar widgets."""
+    done = cubes.done[cubes.done["done_day"] >= _done_cutoff()]
+    lists = set(cubes.status["list"].dropna()) | set(done["origin_list"].dropna()) | set(cubes.due["list"].dropna())
+    return FilterOptions(
+        statuses=sorted(cubes.status["status"].dropna().unique().tolist()),
+        lists=sorted(lists),
+        done_range=_date_bounds(done["done_day"], day),
+        due_range=_date_bounds(cubes.due["due_day"], day),
+    )
+
+
+def slice_cubes(cubes: TaskCubes, filters: DashboardFilters) -> TaskCubes:
+    """
+    Apply the sidebar filters to the cubes with one boolean mask each.
+
+    Statuses only narrow the per-status counts; done counts are narrowed by
+    origin list and done period, due counts by list and due period.
+    """
+    status_mask = np.ones(len(cubes.status), dtype=bool)
+    done_start = max(_day(filters.done_start), _done_cutoff())
+    done_mask = cubes.done["done_day"].between(done_start, _day(filters.done_end)).to_numpy()
+    due_mask = cubes.due["due_day"].between(_day(filters.due_start), _day(filters.due_end)).to_numpy()
+
+    if filters.statuses:
+        status_mask &= cubes.status["status"].isin(filters.statuses).to_numpy()
+    if filters.lists:
+        status_mask &= cubes.status["list"].isin(filters.lists).to_numpy()
+        done_mask &= cubes.done["origin_list"].isin(filters.lists).to_numpy()
+        due_mask &= cubes.due["list"].isin(filters.lists).to_numpy()
+
+    return TaskCubes(status=cubes.status[status_mask], done=cubes.done[done_mask], due=cubes.due[due_mask])
+
+
+def _weekday_counts(done: pd.DataFrame) -> np.ndarray:
+    """Completions per weekday, Monday first."""
+    return np.bincount(done["weekday"].to_numpy(), weights=done["count"].to_numpy(), minlength=7).astype(np.int64)
+
+
+def compute_metrics(sliced: TaskCubes, filters: DashboardFilters) -> DashboardMetrics:
+    total = int(sliced.status["count"].sum())
+    completed = int(sliced.status.loc[sliced.status["status"] == "Done", "count"].sum())
+    done_total = int(sliced.done["count"].sum())
+    weekday_counts = _weekday_counts(sliced.done)
+    days_in_period = max((filters.done_end - filters.done_start).days + 1, 1)
+    return DashboardMetrics(
+        total=total,
+        completed=completed,
+        pending=total - completed,
+        completion_rate=(completed / total * 100) if total else 0.0,
+        best_day=WEEKDAYS[int(weekday_counts.argmax())] if done_total else "N/A",
+        avg_daily=done_total / days_in_period,
+    )
+
+
+def pending_per_list(status: pd.DataFrame) -> pd.DataFrame:
+    pending = status[status["status"] == "Not Done"]
+    return pending.groupby("list", observed=True)["count"].sum().reset_index()
+
+
+def daily_done(done: pd.DataFrame, start: date, end: date) -> pd.DataFrame:
+    """Completions per day over [start, end] with a running total; days without any count as 0."""
+    days = pd.date_range(start=start, end=end, freq="D")
+    offsets = (done["done_day"].to_numpy() - np.datetime64(start, "D")) // ONE_DAY
+    in_range = (offsets >= 0) & (offsets < len(days))
+    counts = np.bincount(
+        offsets[in_range].astype(np.int64), weights=done["count"].to_numpy()[in_range], minlength=len(days)
+    ).astype(np.int64)
+    return pd.DataFrame({"Date": days.date, "Tasks Completed": counts, "Cumulative Tasks": counts.cumsum()})
+
+
+def done_progress(
+    done: pd.DataFrame, start: date, end: date, max_points: int = settings.DASHBOARD_MAX_POINTS
+) -> tuple[pd.DataFrame, str]:
+    """`daily_done` thinned to the resolution that fits `max_points`, keeping each bucket's extremes."""
+    resolution = choose_resolution(start, end, max_points)
+    series = minmax_downsample(daily_done(done, start, end), "Date", ["Tasks Completed"], resolution)
+    return series, resolution
+
+
+def done_by_origin(done: pd.DataFrame) -> pd.DataFrame:
+    counts = done.groupby("origin_list", observed=True)["count"].sum().reset_index()
+    counts = counts[(counts["origin_list"] != "other") & (counts["count"] > 0)]
+    return counts.sort_values("count", ascending=False)
+
+
+def weekday_done(done: pd.DataFrame, order: list[str] = WEEK_ORDER) -> pd.DataFrame:
+    counts = _weekday_counts(done)
+    return pd.DataFrame({"Day": order, "Tasks Completed": [counts[WEEKDAYS.index(day)] for day in order]})
+
+
+def weekday_origin_done(done: pd.DataFrame, order: list[str] = STACK_WEEK_ORDER) -> pd.DataFrame:
+    done = done[done["origin_list"] != "other"]
+    # Position of each Monday-first weekday code within `order`
+    positions = np.array([order.index(day) for day in WEEKDAYS])
+    weekday = pd.Categorical.from_codes(positions[done["weekday"].to_numpy()], categories=order, ordered=True)
+    return (
+        done.assign(weekday=weekday)
+        .groupby(["weekday", "origin_list"], observed=True)["count"]
+        .sum()
+        .reset_index(name="Tasks Completed")
+        .sort_values("weekday")
+    )
+
+
+def age_categories(tasks: pd.DataFrame, old_task_age: int = settings.OLD_TASK_AGE) -> pd.Series:
+    return pd.Series(
+        np.where(tasks["card_age"] > old_task_age, f"Old (>{old_task_age} days)", f"New (≤{old_task_age} days)"),
+        index=tasks.index,
+    )
+
+
+def oldest_pending(pending: pd.DataFrame, rows: int = OLDEST_PENDING_ROWS) -> pd.DataFrame:
+    return pending.nlargest(rows, "card_age")[["card", "card_age", "list"]].assign(
+        age_category=lambda frame: age_categories(frame)
+    )
+
+
+def _buckets(cube: pd.DataFrame, day_column: str, resolution: str) -> pd.Series:
+    """Bucket start of each cube row: the day itself or its precomputed week / month tier."""
+    return cube[day_column] if resolution == "day" else cube[resolution]
+
+
+def calendar_counts(
+    cube: pd.DataFrame, day_column: str, column: str, max_days: int = settings.DASHBOARD_HEATMAP_MAX_DAYS
+) -> tuple[pd.DataFrame, str]:
+    """
+    Count per calendar day as the 'YYYY-MM-DD' strings calplot expects, and "day".
+
+    When the days span more than `max_days`, counts are per month instead
+    (keyed by the 1st) and the resolution is "month".
+    """
+    days = cube[day_column]
+    resolution = "day"
+    if len(days) and (days.max() - days.min()).days + 1 > max_days:
+        resolution = "month"
+    totals = cube["count"].groupby(_buckets(cube, day_column, resolution)).sum()
+    totals.index = pd.DatetimeIndex(totals.index)
+    return pd.DataFrame({column: totals.index.strftime("%Y-%m-%d"), "count": totals.to_numpy()}), resolution
+
+
+def due_workload(
+    due: pd.DataFrame, months: int = DUE_WORKLOAD_MONTHS, max_points: int = settings.DASHBOARD_MAX_POINTS
+) -> tuple[pd.DataFrame, pd.DataFrame, str]:
+    """
+    Due cards per bucket and list for the next `months`, per-bucket totals and the bucket resolution.
+
+    Buckets are days unless that exceeds `max_points`. Buckets without due
+    cards appear once with list "No Due Cards" and count 0.
+    """
+    start = pd.Timestamp.today().normalize()
+    end = start + pd.DateOffset(months=months)
+    resolution = choose_resolution(start.date(), end.date(), max_points)
+    days = pd.DataFrame({"card_due": bucket_starts(pd.date_range(start=start, end=end, freq="D"), resolution).unique()})
+    due = due[due["due_day"].between(days["card_due"].min(), end)]
+    due = pd.DataFrame({
+        "card_due": _buckets(due, "due_day", resolution),
+        "list": due["list"].astype(object).fillna("Unknown"),
+        "count": due["count"],
+    })
+    counts = due.groupby(["card_due", "list"])["count"].sum().reset_index()
+    counts = days.merge(counts, on="card_due", how="left")
+    counts["list"] = counts["list"].fillna("No Due Cards")
+    counts["count"] = counts["count"].fillna(0).astype(int)
+    totals = counts.groupby("card_due", as_index=False)["count"].sum()
+    return counts, totals, resolution
+
+
+def build_dashboard_analytics(
+    cubes: TaskCubes,
+    pending: pd.DataFrame,
+    done_rows: pd.DataFrame,
+    filters: DashboardFilters,
+    day: date,
+) -> DashboardAnalytics:
+    """
+    Every aggregate the dashboard draws.
+
+    Counts come from slices of `cubes`; only the row tables read cards:
+    `pending` (the scored pending view) and `done_rows` (cards done on `day`).
+    """
+    sliced = slice_cubes(cubes, filters)
+    today_start = _utc_day(day)
+    today_end = today_start + pd.Timedelta(days=1)
+
+    pending_match = np.ones(len(pending), dtype=bool)
+    done_match = (
+        done_rows["done_date"].between(
+            max(_utc_day(filters.done_start), today_start, pd.Timestamp(settings.START_DATE, tz="UTC")),
+            min(_utc_day(filters.done_end) + pd.Timedelta(days=1), today_end),
+            inclusive="left",
+        ).to_numpy()
+        & (done_rows["status"] == "Done").to_numpy()
+    )
+    if filters.lists:
+        pending_match &= pending["list"].isin(filters.lists).to_numpy()
+        done_match &= done_rows["origin_list"].isin(filters.lists).to_numpy()
+    if filters.task_query:
+        pending_match &= _name_mask(pending, filters.task_query)
+        done_match &= _name_mask(done_rows, filters.task_query)
+
+    # Pending cards as the status filter sees them, and as the due-date filter sees them
+    show_pending = not filters.statuses or "Not Done" in filters.statuses
+    pending_cards = pending[pending_match & show_pending]
+    due_dates = pending["card_due"]
+    in_due_range = due_dates.between(
+        _utc_day(filters.due_start), _utc_day(filters.due_end) + pd.Timedelta(days=1), inclusive="left"
+    ).to_numpy()
+    due_pending = pending[pending_match & in_due_range]
+    due_dates = due_pending["card_due"]
+
+    progress, done_resolution = done_progress(sliced.done, filters.done_start, filters.done_end)
+    done_calendar, done_calendar_resolution = calendar_counts(sliced.done, "done_day", "done_date")
+    due_calendar, due_calendar_resolution = calendar_counts(sliced.due, "due_day", "card_due")
+    workload, totals, workload_resolution = due_workload(sliced.due)
+    return DashboardAnalytics(
+        pending_cards=pending_cards,
+        metrics=compute_metrics(sliced, filters),
+        pending_per_list=pending_per_list(sliced.status),
+        done_progress=progress,
+        done_resolution=done_resolution,
+        done_by_origin=done_by_origin(sliced.done),
+        weekday_done=weekday_done(sliced.done),
+        weekday_origin_done=weekday_origin_done(sliced.done),
+        done_today=done_rows[done_match],
+        oldest_pending=oldest_pending(pending_cards),
+        done_calendar=done_calendar,
+        done_calendar_resolution=done_calendar_resolution,
+        due_calendar=due_calendar,
+        due_calendar_resolution=due_calendar_resolution,
+        overdue=due_pending[due_dates < today_start].sort_values("card_due"),
+        due_today=due_pending[(due_dates >= today_start) & (due_dates < today_end)].sort_values("card_due"),
+        due_workload=workload,
+        due_totals=totals,
+        due_workload_resolution=workload_resolution,
+    )
+
+
+@dataset_cache.dataset("task_cubes", version=data_version, depends_on=("tasks",), shared=False)
+def load_task_cubes() -> TaskCubes:
+    """The cubes saved by `process_data`; aggregated from the task table if none were saved yet."""
+    cubes = load_cubes()
+    if cubes is None:
+        logger.info("No saved aggregate cubes; building them from the task table")
+        cubes = build_cubes(load_tasks())
+    return cubes
+
+
+def load_done_rows(day: date) -> pd.DataFrame:
+    """Cards done since the start of `day` (UTC); the filter is pushed down to the Parquet reader."""
+    return load_tasks(
+        columns=DONE_ROW_COLUMNS,
+        filters=[("status", "==", "Done"), ("done_date", ">=", _utc_day(day))],
+        day=day,
+    )
+
+
+@dataset_cache.dataset("dashboard_options", version=data_version, depends_on=("tasks",), shared=False)
+def load_filter_options(day: date) -> FilterOptions:
+    return filter_options(load_task_cubes(), day)
+
+
+@dataset_cache.dataset(
+    "dashboard_analytics",
+    version=data_version,
+    depends_on=("tasks",),
+    max_entries=settings.DASHBOARD_MEMO_ENTRIES,
+    max_bytes=settings.DASHBOARD_MEMO_MAX_BYTES,
+    shared=False,
+)
+def load_dashboard_analytics(day: date, filters: DashboardFilters) -> DashboardAnalytics:
+    """Memoized per (data version, day, filters); the result is shared and read-only."""
+    if filters.task_query:
+        # Substring search is not a cube dimension: aggregate just the matching cards
+        tasks = load_tasks(day=day)
+        cubes = build_cubes(tasks[_name_mask(tasks, filters.task_query)])
+    else:
+        cubes = load_task_cubes()
+    return build_dashboard_analytics(cubes, load_pending(day=day), load_done_rows(day), filters, day)
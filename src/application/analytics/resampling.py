@@ -0,0 +1,52 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# Coarsest last; a bucket's nominal length in days decides how many points a span needs
+RESOLUTIONS = ("day", "week", "month")
+BUCKET_DAYS = {"day": 1, "week": 7, "month": 30.44}
+
+
+def choose_resolution(start: date, end: date, max_points: int) -> str:
+    """Finest resolution that draws the span [start, end] in at most `max_points` buckets."""
+    span = (end - start).days + 1
+    for resolution in RESOLUTIONS:
+        if span / BUCKET_DAYS[resolution] <= max_points:
+            return resolution
+    return RESOLUTIONS[-1]
+
+
+def bucket_starts(days, resolution: str) -> pd.DatetimeIndex:
+    """First day of the bucket each of `days` falls in: itself, its Monday or the 1st of its month."""
+    days = pd.DatetimeIndex(days).normalize()
+    if resolution == "day":
+        return days
+    if resolution == "week":
+        return days - pd.to_timedelta(days.dayofweek, unit="D")
+    if resolution == "month":
+        return days - pd.to_timedelta(days.day - 1, unit="D")
+    raise ValueError(f"Unsupported resolution '{resolution}'. Use one of {RESOLUTIONS}.")
+
+
+def minmax_downsample(series: pd.DataFrame, x: str, columns: list[str], resolution: str) -> pd.DataFrame:
+    """
+    Thin a day-level series sorted by `x` to the rows that carry each bucket's extremes.
+
+    Per bucket, the first and last rows and the rows holding the min and max
+    of every column in `columns` are kept, so spikes and dips survive and a
+    line through the kept rows still spans the whole period. At most
+    2 + 2 * len(columns) rows per bucket remain; "day" keeps every row.
+    """
+    if resolution == "day" or series.empty:
+        return series
+    series = series.reset_index(drop=True)
+    codes = pd.factorize(bucket_starts(series[x], resolution))[0]
+    grouped = series.groupby(codes)
+    keep = np.zeros(len(series), dtype=bool)
+    keep[grouped.head(1).index] = True
+    keep[grouped.tail(1).index] = True
+    for column in columns:
+        keep[grouped[column].idxmin().to_numpy()] = True
+        keep[grouped[column].idxmax().to_numpy()] = True
+    return series[keep]
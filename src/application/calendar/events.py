@@ -0,0 +1,166 @@
+import hashlib
+import json
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.core.config import settings
+from src.application.data_pipeline.dataset_cache import dataset_cache
+from src.application.data_pipeline.views import PENDING_FILTERS, load_tasks, tasks_version
+
+EVENT_COLUMNS = ["list", "card", "card_id", "card_due"]
+# Scheduler fields sent to the browser; StartTime and EndTime are derived from "day"
+EVENT_FIELDS = [
+    "Id", "Subject", "StartTime", "EndTime", "IsAllDay", "Description", "Location", "Source",
+    "CardId", "IsReadonly", "HasDueDate", "IsOverdue", "CategoryColor",
+]
+CALENDAR_VIEWS = ["Day", "Week", "WorkWeek", "Month", "Agenda"]
+AGENDA_DAYS = 7
+MONTH_GRID_DAYS = 42  # six weeks, including the neighbouring months' days
+OVERDUE_COLOR, PENDING_COLOR = "#ef4444", "#2563eb"
+ISO_UTC = "%Y-%m-%dT%H:%M:%S+00:00"
+EVENT_START, EVENT_LENGTH = pd.Timedelta(hours=9), pd.Timedelta(hours=1)
+
+
+def _text(values: pd.Series, default: str) -> pd.Series:
+    values = values.astype(object).fillna("").astype(str)
+    return values.mask(values == "", default)
+
+
+def build_events(tasks: pd.DataFrame, day: date) -> pd.DataFrame:
+    """
+    One all-day scheduler event per pending card, built with column operations.
+
+    Cards without a due date are placed on `day`; cards due before it are
+    marked overdue. The `day` column (naive midnight) is what windows filter
+    on; start and end times are only formatted for the rows of a window.
+    """
+    due = tasks["card_due"]
+    has_due = due.notna().to_numpy()
+    today = pd.Timestamp(day)
+    due_day = due.dt.tz_convert(None).dt.normalize().fillna(today)
+    card_id = tasks["card_id"].astype(object).fillna("").astype(str)
+    list_name = _text(tasks["list"], "No Trello list")
+    is_overdue = has_due & (due_day < today).to_numpy()
+
+    return pd.DataFrame({
+        "day": due_day,
+        "Id": "trello-" + card_id.mask(card_id == "", pd.Series(tasks.index.astype(str), index=tasks.index)),
+        "Subject": _text(tasks["card"], "Untitled task"),
+        "IsAllDay": True,
+        "Description": "Trello list: " + list_name,
+        "Location": list_name,
+        "Source": "trello",
+        "CardId": card_id,
+        "IsReadonly": (card_id == "").to_numpy(),
+        "HasDueDate": has_due,
+        "IsOverdue": is_overdue,
+        "CategoryColor": np.where(is_overdue, OVERDUE_COLOR, PENDING_COLOR),
+    }, index=tasks.index).sort_values("day", kind="stable")
+
+
+def _no_tasks() -> pd.DataFrame:
+    return pd.DataFrame({
+        "list": pd.Series(dtype=object),
+        "card": pd.Series(dtype=object),
+        "card_id": pd.Series(dtype=object),
+        "card_due": pd.Series(dtype="datetime64[ns, UTC]"),
+    })
+
+
+@dataset_cache.dataset("calendar_events", version=tasks_version, depends_on=("tasks",))
+def load_events(day: date) -> pd.DataFrame:
+    """Events of every pending card, sorted by day; shared and read-only."""
+    if not settings.TASKS_DATA_PATH.exists():
+        return build_events(_no_tasks(), day)
+    return build_events(load_tasks(columns=EVENT_COLUMNS, filters=PENDING_FILTERS, day=day), day)
+
+
+def calendar_window(view: str, anchor: date) -> tuple[date, date]:
+    """
+    First and last day shown by the scheduler's `view` around `anchor` (weeks start on Sunday).
+
+    Month covers the six-week grid, so days of the neighbouring months are included.
+    """
+    week_start = anchor - timedelta(days=(anchor.weekday() + 1) % 7)
+    if view == "Day":
+        return anchor, anchor
+    if view == "Week":
+        return week_start, week_start + timedelta(days=6)
+    if view == "WorkWeek":
+        return week_start + timedelta(days=1), week_start + timedelta(days=5)
+    if view == "Month":
+        first = anchor.replace(day=1)
+        grid_start = first - timedelta(days=(first.weekday() + 1) % 7)
+        return grid_start, grid_start + timedelta(days=MONTH_GRID_DAYS - 1)
+    if view == "Agenda":
+        return anchor, anchor + timedelta(days=AGENDA_DAYS - 1)
+    raise ValueError(f"Unsupported calendar view '{view}'. Use one of {CALENDAR_VIEWS}.")
+
+
+def move_events(events: pd.DataFrame, due_dates: dict[str, date], day: date) -> pd.DataFrame:
+    """Events of the cards in `due_dates` (CardId -> new due date), moved there and re-flagged against `day`."""
+    moved = events[events["CardId"].isin(list(due_dates))]
+    new_day = pd.to_datetime(moved["CardId"].map(due_dates))
+    is_overdue = (new_day < pd.Timestamp(day)).to_numpy()
+    return moved.assign(
+        day=new_day,
+        HasDueDate=True,
+        IsOverdue=is_overdue,
+        CategoryColor=np.where(is_overdue, OVERDUE_COLOR, PENDING_COLOR),
+    ).sort_values("day", kind="stable")
+
+
+def events_in_window(
+    events: pd.DataFrame, start: date, end: date, due_dates: dict[str, date] | None = None, day: date | None = None
+) -> pd.DataFrame:
+    """
+    Events on days [start, end]; a binary search over the day-sorted feed.
+
+    Cards in `due_dates` were rescheduled after the feed was built and appear
+    on their new day instead.
+    """
+    days = events["day"].to_numpy()
+    lower, upper = np.searchsorted(days, [np.datetime64(start, "D"), np.datetime64(end + timedelta(days=1), "D")])
+    window = events.iloc[lower:upper]
+    if not due_dates:
+        return window
+    moved = move_events(events, due_dates, day or date.today())
+    moved = moved[moved["day"].between(pd.Timestamp(start), pd.Timestamp(end))]
+    return pd.concat([window[~window["CardId"].isin(list(due_dates))], moved])
+
+
+def window_records(
+    events: pd.DataFrame, start: date, end: date, due_dates: dict[str, date] | None = None, day: date | None = None
+) -> list[dict]:
+    """JSON-ready scheduler events for the days [start, end]."""
+    window = events_in_window(events, start, end, due_dates, day)
+    begins = window["day"] + EVENT_START
+    window = window.assign(
+        StartTime=begins.dt.strftime(ISO_UTC),
+        EndTime=(begins + EVENT_LENGTH).dt.strftime(ISO_UTC),
+    )
+    return window[EVENT_FIELDS].to_dict("records")
+
+
+def event_key(record: dict) -> str:
+    """Events are keyed by Trello card; cards without an id fall back to the event id."""
+    return record["CardId"] or record["Id"]
+
+
+def _event_fingerprint(record: dict) -> str:
+    return hashlib.sha1(json.dumps(record, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def diff_events(sent: dict[str, str], records: list[dict]) -> tuple[list[dict], list[str], dict[str, str]]:
+    """
+    Changes that turn the events last sent (key -> fingerprint) into `records`.
+
+    Returns the added or changed events, the keys of removed ones, and the
+    fingerprints to remember as sent.
+    """
+    current = {event_key(record): (_event_fingerprint(record), record) for record in records}
+    upserts = [record for key, (fingerprint, record) in current.items() if sent.get(key) != fingerprint]
+    removed = [key for key in sent if key not in current]
+    return upserts, removed, {key: fingerprint for key, (fingerprint, _) in current.items()}
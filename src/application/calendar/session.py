@@ -0,0 +1,170 @@
+import logging
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Hashable, NamedTuple
+
+import pandas as pd
+
+from src.application.calendar.events import calendar_window, diff_events, window_records
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_VIEW = "Week"
+MAX_RESULTS = 50  # edit outcomes echoed back to the browser
+
+
+class QueuedWrite(NamedTuple):
+    edit_ids: tuple[int, ...]  # every edit coalesced into this write
+    due: date
+    future: Future
+
+
+@dataclass
+class CalendarSession:
+    """
+    Server side of one browser's calendar component.
+
+    The component reports what it shows (view, date, the revision of the
+    events it holds) and the due-date edits made by dragging. In return it
+    gets only the changes between the events it holds and the visible
+    window: added or changed events and removed keys, tagged with the
+    revision they apply to. Changes never acknowledged are sent again, so
+    a rerun interrupted before reaching the browser loses nothing. Edits
+    handed to a write queue are confirmed at once and tracked until their
+    write finishes.
+    """
+
+    view: str = DEFAULT_VIEW
+    anchor: date | None = None
+    mount: str | None = None
+    revision: int = 0
+    acked: int = 0
+    # Fingerprints of the events the component holds at each unacknowledged revision
+    snapshots: dict[int, dict[str, str]] = field(default_factory=lambda: {0: {}})
+    last_changes: dict | None = None
+    last_edit: int = 0
+    result_seq: int = 0
+    results: list[dict] = field(default_factory=list)
+    # Writes per card that have not been settled yet, oldest first
+    queued: dict[str, list[QueuedWrite]] = field(default_factory=dict)
+    # The card's date before its first unsettled write (None: the feed's date), restored if they fail
+    restore_dates: dict[str, date | None] = field(default_factory=dict)
+    # Due dates changed from the calendar since the event feed was built
+    due_dates: dict[str, date] = field(default_factory=dict)
+    data_version: Hashable = None
+
+    def receive(self, message: dict | None, apply_edit: Callable[[str, date], Future | None]) -> None:
+        """
+        Take in the component's latest message: its view and revision, and any new edits.
+
+        `apply_edit` either writes the new due date or queues it and returns a
+        Future. Queued edits are confirmed right away; a write that fails later
+        is reported then, and the card goes back to its previous date.
+        """
+        if not message:
+            return
+        if message.get("mount") != self.mount:
+            # A new iframe numbers its edits from 1 again
+            self.mount, self.last_edit, self.results = message.get("mount"), 0, []
+        self.view = message.get("view") or self.view
+        if message.get("anchor"):
+            self.anchor = date.fromisoformat(message["anchor"])
+        self.acked = int(message.get("revision", 0))
+
+        for edit in message.get("edits", []):
+            if edit["id"] <= self.last_edit:
+                continue
+            self.last_edit = edit["id"]
+            card_id, due = edit["cardId"], date.fromisoformat(edit["due"])
+            try:
+                write = apply_edit(card_id, due)
+            except Exception as e:
+                logger.warning(f"Could not move card {card_id} to {due}: {e}")
+                self._result(edit["id"], card_id, due, str(e))
+                continue
+            if write is not None:
+                self._track(card_id, edit["id"], due, write)
+            self.due_dates[card_id] = due
+            self._result(edit["id"], card_id, due)
+
+    def _track(self, card_id: str, edit_id: int, due: date, future: Future) -> None:
+        writes = self.queued.setdefault(card_id, [])
+        if not writes:
+            self.restore_dates[card_id] = self.due_dates.get(card_id)
+        if writes and writes[-1].future is future:
+            # Coalesced by the queue into the write still waiting to be sent
+            writes[-1] = QueuedWrite(writes[-1].edit_ids + (edit_id,), due, future)
+        else:
+            writes.append(QueuedWrite((edit_id,), due, future))
+
+    def settle_writes(self) -> None:
+        """Report queued writes that failed since the last rerun, and undo their moves."""
+        for card_id, writes in list(self.queued.items()):
+            # A card's writes finish in order, so only a finished prefix can be settled
+            while writes and writes[0].future.done():
+                write = writes.pop(0)
+                error = write.future.exception()
+                if error is None:
+                    self.restore_dates[card_id] = write.due
+                    continue
+                for edit_id in write.edit_ids:
+                    self._result(edit_id, card_id, write.due, str(error))
+                if not writes:
+                    # Trello keeps the last date it accepted; a later queued move still stands
+                    restore = self.restore_dates[card_id]
+                    if restore is None:
+                        self.due_dates.pop(card_id, None)
+                    else:
+                        self.due_dates[card_id] = restore
+            if not writes:
+                del self.queued[card_id]
+                del self.restore_dates[card_id]
+
+    def _result(self, edit_id: int, card_id: str, due: date, error: str | None = None) -> None:
+        self.result_seq += 1
+        self.results.append({
+            "seq": self.result_seq,
+            "id": edit_id,
+            "cardId": card_id,
+            "due": due.isoformat(),
+            "ok": error is None,
+            "message": error or "",
+        })
+        self.results = self.results[-MAX_RESULTS:]
+
+    def acks(self) -> dict:
+        # While writes are outstanding the component checks back, so late failures reach it
+        return {"mount": self.mount, "results": self.results, "queued": len(self.queued)}
+
+    def changes(self, events: pd.DataFrame, day: date, data_version: Hashable) -> dict:
+        """
+        Event changes for the component: {"base", "revision", "upsert", "remove"}.
+
+        They apply on top of revision `base`; a `base` of None means the
+        component must drop its Trello events first.
+        """
+        self.settle_writes()
+        if data_version != self.data_version:
+            # A refreshed feed already carries (or has overridden) the calendar's moves
+            self.data_version, self.due_dates = data_version, {}
+        start, end = calendar_window(self.view, self.anchor or day)
+        records = window_records(events, start, end, self.due_dates, day)
+
+        base = self.acked if self.acked in self.snapshots else None
+        upserts, removed, snapshot = diff_events(self.snapshots.get(base, {}), records)
+        if base is not None and not upserts and not removed:
+            return {"base": base, "revision": base, "upsert": [], "remove": []}
+        if self.last_changes is not None and self.last_changes["base"] == base and self.snapshots[self.revision] == snapshot:
+            return self.last_changes
+
+        self.revision += 1
+        self.snapshots[self.revision] = snapshot
+        # Revisions older than the acknowledged one can no longer be a base
+        self.snapshots = {
+            revision: sent for revision, sent in self.snapshots.items()
+            if revision == 0 or revision >= self.acked
+        }
+        self.last_changes = {"base": base, "revision": self.revision, "upsert": upserts, "remove": removed}
+        return self.last_changes
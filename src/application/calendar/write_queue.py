@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable
+
+from src.core.config import settings
+from src.infrastructure.trello.trello_client import update_card_due_date
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingWrite:
+    due: date
+    queued_at: float
+    future: Future = field(default_factory=Future)
+
+
+class DueDateWriteQueue:
+    """
+    Server-side queue for due-date edits made in the calendar.
+
+    Edits wait up to `window` seconds after the first queued one. A card
+    moved several times in that window is written once, with its last
+    date. Each flush then sends one update per card, at most `concurrency`
+    at a time, through `write` (the Trello client by default, so
+    credentials stay on the server). A card moved while its update is in
+    flight goes into the next flush, so writes to a card never overtake
+    each other.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str, date], None] = update_card_due_date,
+        window: float = settings.CALENDAR_WRITE_WINDOW,
+        concurrency: int = settings.CALENDAR_WRITE_CONCURRENCY,
+    ):
+        if window < 0 or concurrency < 1:
+            raise ValueError("window must be >= 0 and concurrency >= 1")
+        self.write = write
+        self.window = window
+        self.concurrency = concurrency
+        self.submitted = 0
+        self.sent = 0
+        self._pending: dict[str, _PendingWrite] = {}
+        self._flushing = False
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+    def submit(self, card_id: str, due: date) -> Future:
+        """
+        Queue `card_id`'s new due date and return right away.
+
+        The future resolves to the date written once Trello has the update,
+        or raises its error. Edits coalesced into one write share a future.
+        """
+        if not card_id:
+            raise ValueError("Card ID is required")
+        with self._condition:
+            pending = self._pending.get(card_id)
+            if pending is None:
+                pending = self._pending[card_id] = _PendingWrite(due, time.monotonic())
+            else:
+                pending.due = due
+            self.submitted += 1
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="due-date-writes", daemon=True)
+                self._worker.start()
+            self._condition.notify_all()
+            return pending.future
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send queued edits now and wait for them; False if `timeout` ran out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            for pending in self._pending.values():
+                pending.queued_at = float("-inf")
+            self._condition.notify_all()
+            while self._pending or self._flushing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                # The window starts with the oldest queued edit, so steady dragging cannot delay a write forever
+                while self._pending:
+                    remaining = min(p.queued_at for p in self._pending.values()) + self.window - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._pending = self._pending, {}
+                self._flushing = True
+            try:
+                self._send(batch)
+            finally:
+                with self._condition:
+                    self._flushing = False
+                    self._condition.notify_all()
+
+    def _send(self, batch: dict[str, _PendingWrite]) -> None:
+        def send(card_id: str, pending: _PendingWrite) -> None:
+            try:
+                self.write(card_id, pending.due)
+            except Exception as e:
+                logger.warning(f"Could not move card {card_id} to {pending.due}: {e}")
+                pending.future.set_exception(e)
+            else:
+                pending.future.set_result(pending.due)
+
+        self.sent += len(batch)
+        with ThreadPoolExecutor(max_workers=min(len(batch), self.concurrency)) as pool:
+            for card_id, pending in batch.items():
+                pool.submit(send, card_id, pending)
+        logger.info(f"Wrote {len(batch)} due dates to Trello ({self.submitted} edits queued so far)")
+
+
+# Shared by every session of the process, so edits from all open calendars are coalesced together
+due_date_queue = DueDateWriteQueue()
@@ -0,0 +1,98 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from src.core.config import settings
+from src.application.analytics.resampling import bucket_starts
+from src.infrastructure.persistence.storage import load_frame, save_frame
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CUBE_NAMES = ("status", "done", "due")
+# Coarser time tiers stored next to each day, as the start of its bucket
+TIERS = ("week", "month")
+DAY_COLUMNS = {"done": "done_day", "due": "due_day"}
+
+
+@dataclass(frozen=True)
+class TaskCubes:
+    """
+    Pre-aggregated card counts over the dimensions the dashboard groups by.
+
+    status: status x list                                  (every card)
+    done:   done_day x weekday x origin_list x list        (completed cards)
+    due:    due_day x list                                 (pending cards with a due date)
+
+    Days are UTC calendar days (naive timestamps at midnight) and weekday is
+    Monday=0. Each cube has one row per observed combination with its `count`,
+    so its size is bounded by days x lists rather than by the number of cards.
+    The done and due cubes also carry `week` and `month`, the start of the
+    bucket each day falls in, so charts can switch tiers with a plain groupby.
+    """
+
+    status: pd.DataFrame
+    done: pd.DataFrame
+    due: pd.DataFrame
+
+
+def _utc_day(values: pd.Series) -> pd.Series:
+    return values.dt.tz_convert(None).dt.normalize()
+
+
+def _count(data: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    counts = data.groupby(by, observed=True, dropna=False).size().reset_index(name="count")
+    return counts.astype({"count": "int32"})
+
+
+def with_tiers(cube: pd.DataFrame, day_column: str) -> pd.DataFrame:
+    """`cube` with a bucket-start column per tier, derived from `day_column`."""
+    return cube.assign(**{tier: bucket_starts(cube[day_column], tier) for tier in TIERS})
+
+
+def build_cubes(tasks: pd.DataFrame) -> TaskCubes:
+    """Aggregate the processed task table (or any subset of it) into cubes."""
+    done = tasks[(tasks["status"] == "Done") & tasks["done_date"].notna()]
+    done_day = _utc_day(done["done_date"])
+    pending = tasks[(tasks["status"] == "Not Done") & tasks["card_due"].notna()]
+    done = _count(
+        done.assign(done_day=done_day, weekday=done_day.dt.dayofweek.astype("int8")),
+        ["done_day", "weekday", "origin_list", "list"],
+    )
+    due = _count(pending.assign(due_day=_utc_day(pending["card_due"])), ["due_day", "list"])
+    return TaskCubes(
+        status=_count(tasks, ["status", "list"]),
+        done=with_tiers(done, DAY_COLUMNS["done"]),
+        due=with_tiers(due, DAY_COLUMNS["due"]),
+    )
+
+
+def _cube_path(name: str, directory: Path) -> Path:
+    return directory / f"{name}.parquet"
+
+
+def save_cubes(cubes: TaskCubes, directory: str | Path | None = None) -> None:
+    directory = Path(directory or settings.CUBES_DIR)
+    for name in CUBE_NAMES:
+        save_frame(getattr(cubes, name), _cube_path(name, directory))
+    logger.info(f"Saved aggregate cubes to {directory}")
+
+
+def load_cubes(directory: str | Path | None = None) -> TaskCubes | None:
+    """Cubes written by `save_cubes`, or None if any of them is missing."""
+    directory = Path(directory or settings.CUBES_DIR)
+    try:
+        return TaskCubes(**{name: load_frame(_cube_path(name, directory)) for name in CUBE_NAMES})
+    except FileNotFoundError:
+        return None
+
+
+def cubes_version(directory: str | Path | None = None) -> int | None:
+    """Data-version token of the saved cubes (newest mtime), None if none were written yet."""
+    directory = Path(directory or settings.CUBES_DIR)
+    try:
+        return max(_cube_path(name, directory).stat().st_mtime_ns for name in CUBE_NAMES)
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,187 @@
+import dataclasses
+import hashlib
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from src.domain.ports.cache_backend import CacheBackend
+from src.infrastructure.cache.backends import cache_backend
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 8
+# Shared entries are keyed by version, so old ones are only garbage; let the backend expire them
+SHARED_TTL = 24 * 60 * 60  # seconds
+
+
+def estimate_bytes(value: Any) -> int:
+    """Approximate in-memory size of a cached value: deep size of frames, summed over containers and dataclasses."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return sum(estimate_bytes(getattr(value, item.name)) for item in dataclasses.fields(value))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(k) + estimate_bytes(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+@dataclass
+class Dataset:
+    name: str
+    loader: Callable[..., Any]
+    version: Callable[[], Hashable]
+    depends_on: tuple[str, ...] = ()
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    shared: bool = True
+    max_bytes: int | None = None
+    entries: OrderedDict = field(default_factory=OrderedDict)
+    sizes: dict = field(default_factory=dict)
+    shared_keys: set[str] = field(default_factory=set)
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+
+class DatasetCache:
+    """
+    Process-wide cache of read-only datasets, shared by every session and thread.
+
+    Each dataset is registered with a loader and a version token (e.g. the
+    source file's mtime). Entries are keyed by (version, loader arguments), so a
+    new version is picked up on the next read and older ones are dropped. Hits
+    return the cached object itself, never a copy: callers must not mutate it.
+
+    With a shared `backend` (on-disk Arrow or Redis), a local miss is looked up
+    there before calling the loader, so replicas parse each version only once.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None):
+        self.backend = backend if backend is not None and backend.shared else None
+        self._datasets: dict[str, Dataset] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[..., Any],
+        version: Callable[[], Hashable],
+        depends_on: tuple[str, ...] = (),
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        shared: bool = True,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Register `loader` under `name`. Registering again swaps the loader and keeps cached entries.
+
+        Least recently used entries are evicted beyond `max_entries`, and
+        beyond `max_bytes` of estimated memory if given (the newest entry is
+        always kept). `shared=False` keeps the dataset out of the shared
+        backend (for values that are not DataFrames or JSON-serializable).
+        """
+        with self._lock:
+            dataset = self._datasets.get(name)
+            if dataset is None:
+                self._datasets[name] = Dataset(
+                    name, loader, version, tuple(depends_on), max_entries, shared, max_bytes
+                )
+            else:
+                dataset.loader, dataset.version = loader, version
+                dataset.depends_on, dataset.max_entries, dataset.shared = tuple(depends_on), max_entries, shared
+                dataset.max_bytes = max_bytes
+
+    def dataset(self, name: str, version: Callable[[], Hashable], **options) -> Callable:
+        """Decorator form of `register`; calling the decorated function reads through the cache."""
+        def decorator(loader: Callable[..., Any]) -> Callable[..., Any]:
+            self.register(name, loader, version, **options)
+
+            @wraps(loader)
+            def cached(*args):
+                return self.get(name, *args)
+            return cached
+        return decorator
+
+    def _dataset(self, name: str) -> Dataset:
+        try:
+            return self._datasets[name]
+        except KeyError:
+            raise ValueError(f"Unknown dataset '{name}'") from None
+
+    def get(self, name: str, *args: Hashable) -> Any:
+        dataset = self._dataset(name)
+        version = dataset.version()
+        key = (version, args)
+        with dataset.lock:
+            if key in dataset.entries:
+                dataset.entries.move_to_end(key)
+                return dataset.entries[key]
+            # Entries of any other version are stale
+            for stale in [entry for entry in dataset.entries if entry[0] != version]:
+                self._evict(dataset, stale)
+            value = self._load(dataset, version, args)
+            dataset.entries[key] = value
+            if dataset.max_bytes is not None:
+                dataset.sizes[key] = estimate_bytes(value)
+            while len(dataset.entries) > dataset.max_entries or (
+                len(dataset.entries) > 1 and self._over_budget(dataset)
+            ):
+                self._evict(dataset, next(iter(dataset.entries)))
+            return value
+
+    @staticmethod
+    def _over_budget(dataset: Dataset) -> bool:
+        return dataset.max_bytes is not None and sum(dataset.sizes.values()) > dataset.max_bytes
+
+    @staticmethod
+    def _evict(dataset: Dataset, key: tuple) -> None:
+        del dataset.entries[key]
+        dataset.sizes.pop(key, None)
+
+    def memory_usage(self, name: str) -> tuple[int, int | None]:
+        """(entries, estimated bytes) cached for `name`; bytes are only tracked with `max_bytes`."""
+        dataset = self._dataset(name)
+        with dataset.lock:
+            return len(dataset.entries), sum(dataset.sizes.values()) if dataset.max_bytes is not None else None
+
+    def _load(self, dataset: Dataset, version: Hashable, args: tuple) -> Any:
+        if self.backend is None or not dataset.shared or version is None:
+            return dataset.loader(*args)
+        digest = hashlib.sha256(repr(args).encode("utf-8")).hexdigest()
+        shared_key = f"dataset:{dataset.name}:{version}:{digest}"
+        value = self.backend.get(shared_key)
+        if value is None:
+            value = dataset.loader(*args)
+            if isinstance(value, (pd.DataFrame, list, dict)):
+                self.backend.set(shared_key, value, ttl=SHARED_TTL)
+        dataset.shared_keys.add(shared_key)
+        return value
+
+    def invalidate(self, name: str) -> None:
+        """Drop `name` and every dataset derived from it; other datasets stay warm."""
+        dataset = self._dataset(name)
+        with dataset.lock:
+            dataset.entries.clear()
+            dataset.sizes.clear()
+            if self.backend is not None:
+                for shared_key in dataset.shared_keys:
+                    self.backend.delete(shared_key)
+            dataset.shared_keys.clear()
+        logger.info(f"Invalidated dataset '{name}'")
+        for dependent in [other.name for other in self._datasets.values() if name in other.depends_on]:
+            self.invalidate(dependent)
+
+    def clear(self) -> None:
+        for dataset in list(self._datasets.values()):
+            with dataset.lock:
+                dataset.entries.clear()
+                dataset.sizes.clear()
+
+
+dataset_cache = DatasetCache(backend=cache_backend)
@@ -1,9 +1,13 @@
 import logging
-import requests
+import time
 import pandas as pd
 import numpy as np
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable
 from src.core.config import settings
+from src.application.data_pipeline.schema import apply_task_dtypes
+from src.infrastructure.persistence.task_store import TASK_COLUMNS, TaskStore
+from src.infrastructure.trello.trello_client import REQUEST_TIMEOUT, batch_get, get_session
 from dotenv import dotenv_values
 from pathlib import Path
 
@@ -29,41 +33,59 @@ url_cards = f"{BASE_URL}/cards"
 url_lists = f"{BASE_URL}/lists"
 BOARD_ACTIONS_URL = f"{BASE_URL}/actions"
 DONE_LIST_NAME = settings.DONE_LIST_NAME
+ACTIONS_PAGE_LIMIT = 1000  # max page size accepted by Trello
+LIST_MOVE_FILTER = "updateCard:idList"
 
 query = {
   'key': APIKey,
   'token': APIToken
 }
 
-def calculate_card_age_days(date_last_activity: str) -> int:
-    last_activity = datetime.fromisoformat(
-        date_last_activity.replace("Z", "+00:00")
-    )
-    now = datetime.now(timezone.utc)
-
-    return (now - last_activity).days
-
-def fetch_data():
-    logger.info("Fetching Data..")
+def _get_json(url: str, params: dict):
+    response = get_session().get(url, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
 
-    # get all cards
-    response_cards = requests.request(
-       "GET",
-       url_cards,
-       params=query
-    )
-    cards = response_cards.json()
-
-    # get all lists
-    response_lists = requests.request(
-       "GET",
-       url_lists,
-       params=query
-    )
-    lists = response_lists.json()
+def _timed(func, *args, **kwargs):
+    """Run `func` and return its result with the wall time it took, in seconds."""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
 
-    # lists and cards combined
-    list_map = {lst["id"]: lst["name"] for lst in lists}
+def request_action_page(before: str | None = None, since: str | None = None, limit: int = ACTIONS_PAGE_LIMIT, action_filter: str | None = LIST_MOVE_FILTER) -> list[dict]:
+    params = {
+        **query,
+        "limit": limit
+    }
+    if action_filter:
+        params["filter"] = action_filter
+    if before:
+        params["before"] = before
+    if since:
+        params["since"] = since
+
+    return _get_json(BOARD_ACTIONS_URL, params)
+
+def iter_action_pages(since: str | None = None, page_size: int = ACTIONS_PAGE_LIMIT, fetch_page=request_action_page, **page_params):
+    """
+    Yield pages of board actions, newest first, until the history is exhausted.
+
+    Trello caps every response at `page_size` actions, so the id of the oldest
+    action in a page becomes the `before` cursor of the next request. `since`
+    bounds the walk from below. Pages are yielded as they arrive, so a
+    consumer that reduces each one holds a single page at a time.
+    """
+    before = None
+    while True:
+        page = fetch_page(before=before, since=since, limit=page_size, **page_params)
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        before = page[-1]["id"]
+
+def build_task_frame(cards: list[dict], list_map: dict[str, str]) -> pd.DataFrame:
     list_data = []
     for card in cards:
         list_data.append({
@@ -71,60 +93,137 @@ def fetch_data():
             "card": card['name'],
             'card_id': card['id'],
             'card_due': card['due'],
-            'card_age': calculate_card_age_days(card['dateLastActivity'])
+            'card_last_activity': card['dateLastActivity']
             })    
         
-    data = pd.DataFrame(list_data) 
+    data = pd.DataFrame(list_data, columns=TASK_COLUMNS[:5]) 
+    data['card_due'] = pd.to_datetime(data['card_due'], errors='coerce', utc=True)
+    data['card_last_activity'] = pd.to_datetime(data['card_last_activity'], utc=True)
 
     # add columns
     data["status"] = "Not Done"
-    data["done_date"] = pd.NaT
+    data["done_date"] = pd.Series(pd.NaT, index=data.index, dtype="datetime64[ns, UTC]")
     data['origin_list'] = None
+    return data
+
+def _dig(values: pd.Series, *keys: str) -> pd.Series:
+    """Pull a nested field out of a column of action dicts, None where it is missing."""
+    items = values.tolist()
+    for key in keys:
+        items = [item.get(key) if isinstance(item, dict) else None for item in items]
+    return pd.Series(items, index=values.index, dtype=object)
+
+def done_moves(page: list[dict]) -> pd.DataFrame:
+    """
+    Normalize a page of actions into the moves from a non-Done list into Done.
+
+    Returns one row per move with `card_id`, `done_date` (ISO string) and
+    `origin_list` (name of the list the card left).
+    """
+    actions = pd.DataFrame.from_records(page, columns=["type", "date", "data"])
+    list_after = _dig(actions["data"], "listAfter", "name")
+
+    # Narrow to moves into Done before unpacking the remaining fields
+    moves = actions[(actions["type"] == "updateCard") & (list_after == DONE_LIST_NAME)]
+    list_before = _dig(moves["data"], "listBefore", "name")
+    moves = pd.DataFrame({
+        "card_id": _dig(moves["data"], "card", "id"),
+        "done_date": moves["date"],
+        "origin_list": list_before,
+    })
+    return moves[list_before != DONE_LIST_NAME]
+
+class FirstDoneMoves:
+    """
+    Running earliest move into Done per card, fed pages of actions as Trello serves them.
+
+    Pages and the actions inside them run newest first, so each card's move in
+    a later page (or later in the same page) is older and simply overwrites
+    the one held. Each page costs O(page) and memory holds one entry per card.
+    """
+
+    def __init__(self):
+        self._moves: dict[str, tuple[str, str | None]] = {}
+
+    def add(self, page: list[dict]) -> None:
+        moves = done_moves(page).drop_duplicates(subset="card_id", keep="last")
+        self._moves.update(zip(moves["card_id"], zip(moves["done_date"], moves["origin_list"])))
+
+    def frame(self) -> pd.DataFrame:
+        """One row per card with `card_id`, `done_date` (parsed as UTC) and `origin_list`."""
+        dates, origins = zip(*self._moves.values()) if self._moves else ((), ())
+        return pd.DataFrame({
+            "card_id": pd.Series(list(self._moves), dtype=object),
+            "done_date": pd.to_datetime(pd.Series(dates, dtype=object), utc=True),
+            "origin_list": pd.Series(origins, dtype=object),
+        })
+
+def first_done_moves(pages: Iterable[list[dict]]) -> pd.DataFrame:
+    """Earliest move into Done per card over pages of actions (newest first), reduced as they arrive."""
+    first = FirstDoneMoves()
+    for page in pages:
+        first.add(page)
+    return first.frame()
+
+def apply_done_transitions(data: pd.DataFrame, transitions: pd.DataFrame, list_names: set[str]) -> pd.DataFrame:
+    """Join first-Done transitions onto the task frame by `card_id`."""
+    transitions = transitions.assign(
+        origin_list=transitions["origin_list"].where(transitions["origin_list"].isin(list_names), "other"),
+    )
+    data = data.drop(columns=["status", "done_date", "origin_list"]).merge(
+        transitions[["card_id", "done_date", "origin_list"]], on="card_id", how="left"
+    )
+    data.insert(TASK_COLUMNS.index("status"), "status", np.where(data["done_date"].notna(), "Done", "Not Done"))
+    return data[TASK_COLUMNS]
 
-    params = {
-        **query,
-        "filter": "updateCard:idList",  # only list moves
-        "limit": 1000                   # increase if needed
+def fetch_lists() -> list[dict]:
+    return _get_json(url_lists, query)
+
+def fetch_cards() -> list[dict]:
+    return _get_json(url_cards, query)
+
+def collect_done_transitions(since: str | None = None) -> pd.DataFrame:
+    return first_done_moves(iter_action_pages(since=since))
+
+def fetch_cards_by_id(card_ids: list[str]) -> list[dict | None]:
+    """Return the given cards in order, with None for cards Trello no longer serves."""
+    return batch_get([f"/cards/{card_id}" for card_id in card_ids])
+
+def fetch_cards_by_list(list_ids: list[str]) -> list[list[dict] | None]:
+    """Return the open cards on each of the given lists, in order, with None for lists Trello no longer serves."""
+    return batch_get([f"/lists/{list_id}/cards" for list_id in list_ids])
+
+def fetch_data() -> pd.DataFrame:
+    logger.info("Fetching Data..")
+
+    # Cards, lists and the action history are independent, so request them together
+    endpoints = {
+        "cards": fetch_cards,
+        "lists": fetch_lists,
+        "actions": collect_done_transitions,
     }
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+        futures = {name: pool.submit(_timed, func) for name, func in endpoints.items()}
+        results = {name: future.result() for name, future in futures.items()}
 
-    response = requests.get(BOARD_ACTIONS_URL, params=params)
-    actions = response.json()
-    actions = sorted(actions, key=lambda x: x['date'])
-
-    done_transitions = {}
-    for action in actions:
-        action_data = action.get("data", {})
-        if action.get("type") != "updateCard":
-            continue
-
-        list_after = action_data.get("listAfter", {}).get("name")
-        list_before = action_data.get("listBefore", {}).get("name")
-        card_info = action_data.get("card", {})
-        card_id = card_info.get("id")
-
-        # Only consider first move from a non-Done list to Done
-        if list_after == DONE_LIST_NAME and list_before != DONE_LIST_NAME and card_id not in done_transitions:
-            origin_list = list_before if list_before in list_map.values() else "other"
-            done_transitions[card_id] = {
-                "origin_list": origin_list,
-                "done_date": action["date"]
-            }
-
-    done_mask = data['card_id'].isin(done_transitions.keys())
-
-    # Update only the relevant rows
-    data.loc[done_mask, 'status'] = 'Done'
-    data.loc[done_mask, 'done_date'] = data.loc[done_mask, 'card_id'].map(
-        lambda x: pd.to_datetime(done_transitions[x]['done_date']).tz_convert(None)
-    )
-    data.loc[done_mask, 'origin_list'] = data.loc[done_mask, 'card_id'].map(
-        lambda x: done_transitions[x]['origin_list']
-    )
+    for name, (_, elapsed) in results.items():
+        logger.info(f"Fetched {name} in {elapsed:.2f}s")
+
+    cards = results["cards"][0]
+    lists = results["lists"][0]
+    done_transitions = results["actions"][0]
+
+    # lists and cards combined
+    list_map = {lst["id"]: lst["name"] for lst in lists}
+    data = build_task_frame(cards, list_map)
+    data = apply_done_transitions(data, done_transitions, set(list_map.values()))
+    data = apply_task_dtypes(data)
 
     # Save Raw Data
-    data.to_csv(str(settings.RAW_DATA_PATH), index=False, encoding="utf-8")
+    TaskStore().replace_all(data)
 
     logger.info("Fetching Tasks is Done!")
+    return data
 
 if __name__ == "__main__":
     fetch_data()
@@ -0,0 +1,112 @@
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+
+from src.application.data_pipeline.pipeline import refresh_pipeline, refresh_tasks
+from src.infrastructure.persistence.file_lock import LockHeldError
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+FINISHED = {SUCCEEDED, FAILED}
+MAX_FINISHED_JOBS = 20
+
+
+@dataclass
+class RefreshJob:
+    job_id: str
+    full_resync: bool
+    status: str = QUEUED
+    stage: str | None = None
+    completed: list[str] = field(default_factory=list)
+    total_steps: int = 0
+    submitted_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def progress(self) -> float:
+        if self.status == SUCCEEDED:
+            return 1.0
+        return len(self.completed) / self.total_steps if self.total_steps else 0.0
+
+
+class RefreshJobRunner:
+    """
+    Runs data refreshes on one background worker thread and keeps a registry of jobs.
+
+    Submitting while a refresh is queued or running returns that job instead
+    of starting another. Readers poll `get` for snapshots of a job's state; the
+    new dataset becomes visible to them when the pipeline's write is renamed into place.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh")
+        self._lock = threading.Lock()
+        self._jobs: dict[str, RefreshJob] = {}
+
+    def submit(self, full_resync: bool = False) -> str:
+        with self._lock:
+            active = next((job for job in self._jobs.values() if not job.finished), None)
+            if active:
+                return active.job_id
+            job = RefreshJob(uuid.uuid4().hex, full_resync, total_steps=len(refresh_pipeline.step_names))
+            self._jobs[job.job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job.job_id)
+        return job.job_id
+
+    def get(self, job_id: str) -> RefreshJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job, completed=list(job.completed)) if job else None
+
+    def latest(self) -> RefreshJob | None:
+        with self._lock:
+            job_id = next(reversed(self._jobs), None)
+        return self.get(job_id) if job_id else None
+
+    def _update(self, job_id: str, **changes) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            for name, value in changes.items():
+                setattr(job, name, value)
+
+    def _on_stage(self, job_id: str, stage: str | None) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            if job.stage:
+                job.completed.append(job.stage)
+            job.stage = stage
+
+    def _run(self, job_id: str) -> None:
+        self._update(job_id, status=RUNNING)
+        full_resync = self._jobs[job_id].full_resync
+        try:
+            refresh_tasks(full_resync=full_resync, on_stage=lambda stage: self._on_stage(job_id, stage))
+        except LockHeldError:
+            error = "Another refresh (scheduler or command line) is already running"
+            self._update(job_id, status=FAILED, error=error, finished_at=datetime.now(timezone.utc))
+            return
+        except Exception as e:
+            logger.exception("Refresh job failed")
+            self._update(job_id, status=FAILED, error=str(e), finished_at=datetime.now(timezone.utc))
+            return
+        self._on_stage(job_id, None)
+        self._update(job_id, status=SUCCEEDED, finished_at=datetime.now(timezone.utc))
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:-MAX_FINISHED_JOBS]:
+            del self._jobs[job_id]
+
+
+refresh_jobs = RefreshJobRunner()
@@ -0,0 +1,175 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from src.core.config import settings
+from src.application.data_pipeline.processor import IncrementalProcessor, add_scoring_inputs
+from src.application.data_pipeline.schema import apply_task_dtypes
+from src.application.data_pipeline.sync import sync_data
+from src.application.data_pipeline.views import add_relative_columns, done_view, pending_view, utc_today
+from src.infrastructure.persistence.file_lock import FileLock
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(value: Any) -> int | None:
+    """Content hash of a DataFrame, or None for values that cannot be cached."""
+    if not isinstance(value, pd.DataFrame):
+        return None
+    return hash((tuple(value.columns), int(pd.util.hash_pandas_object(value, index=False).sum())))
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[[Any], Any]
+    cacheable: bool = False
+    # Extra cache key for stages whose output also depends on something besides the input
+    cache_context: Callable[[], Hashable] | None = None
+
+
+@dataclass
+class PipelineRun:
+    outputs: dict[str, Any] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    cache_hits: list[str] = field(default_factory=list)
+
+    @property
+    def result(self) -> Any:
+        return next(reversed(self.outputs.values()), None)
+
+
+class Pipeline:
+    """
+    Ordered stages that hand their output to the next stage in memory.
+
+    Cacheable stages remember their last input fingerprint and output, so an
+    unchanged input skips the work. Sinks receive the final output; they are
+    side effects only and can be switched off per run.
+    """
+
+    def __init__(self):
+        self.stages: list[Stage] = []
+        self.sinks: list[Stage] = []
+        self._cache: dict[str, tuple[int, Any]] = {}
+
+    def stage(
+        self,
+        name: str,
+        func: Callable[[Any], Any],
+        cacheable: bool = False,
+        cache_context: Callable[[], Hashable] | None = None,
+    ) -> "Pipeline":
+        self.stages.append(Stage(name, func, cacheable, cache_context))
+        return self
+
+    def sink(self, name: str, func: Callable[[Any], Any]) -> "Pipeline":
+        self.sinks.append(Stage(name, func))
+        return self
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _run_stage(self, stage: Stage, value: Any, run: PipelineRun) -> Any:
+        key = fingerprint(value) if stage.cacheable else None
+        if key is not None and stage.cache_context is not None:
+            key = hash((key, stage.cache_context()))
+        cached = self._cache.get(stage.name)
+        started = time.perf_counter()
+        if key is not None and cached is not None and cached[0] == key:
+            output = cached[1]
+            run.cache_hits.append(stage.name)
+        else:
+            output = stage.func(value)
+            if key is not None:
+                self._cache[stage.name] = (key, output)
+        run.timings[stage.name] = time.perf_counter() - started
+        return output
+
+    @property
+    def step_names(self) -> list[str]:
+        return [stage.name for stage in self.stages + self.sinks]
+
+    def run(
+        self,
+        value: Any = None,
+        persist: bool = True,
+        on_stage: Callable[[str], None] | None = None,
+    ) -> PipelineRun:
+        """Run every stage, then the sinks; `on_stage` is called with each step name before it starts."""
+        run = PipelineRun()
+        for stage in self.stages:
+            if on_stage:
+                on_stage(stage.name)
+            value = self._run_stage(stage, value, run)
+            run.outputs[stage.name] = value
+        if persist:
+            for sink in self.sinks:
+                if on_stage:
+                    on_stage(sink.name)
+                started = time.perf_counter()
+                sink.func(value)
+                run.timings[sink.name] = time.perf_counter() - started
+
+        timings = ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in run.timings.items())
+        logger.info(f"Pipeline finished ({timings}); cached: {run.cache_hits or 'none'}")
+        return run
+
+
+@dataclass
+class TaskSplit:
+    tasks: pd.DataFrame
+    done: pd.DataFrame
+    pending: pd.DataFrame
+
+
+def split_tasks(tasks: pd.DataFrame) -> TaskSplit:
+    """Done and scored pending views of the processed table, relative to today."""
+    current = apply_task_dtypes(add_relative_columns(tasks, utc_today()))
+    return TaskSplit(tasks=tasks, done=done_view(current), pending=pending_view(current))
+
+
+def build_refresh_pipeline(processor: IncrementalProcessor | None = None) -> Pipeline:
+    """
+    fetch -> derive -> score -> split, with the Parquet table as the persistence sink.
+
+    The derive stage only reprocesses cards whose content fingerprint changed,
+    and the sink skips the write when nothing did.
+    """
+    processor = processor or IncrementalProcessor()
+    return (
+        Pipeline()
+        .stage("fetch", lambda full_resync: sync_data(full_resync=bool(full_resync)))
+        .stage("derive", processor.update)
+        .stage("score", add_scoring_inputs, cacheable=True)
+        .stage("split", split_tasks, cacheable=True, cache_context=utc_today)
+        .sink("persist", lambda split: processor.save(split.tasks))
+    )
+
+
+refresh_pipeline = build_refresh_pipeline()
+
+
+def refresh_tasks(
+    full_resync: bool = False,
+    persist: bool = True,
+    on_stage: Callable[[str], None] | None = None,
+) -> TaskSplit:
+    """
+    Sync with Trello and rebuild the processed task table in one pass.
+
+    Holds the sync lock file for the whole run, so refreshes started from the
+    app, the scheduler or the command line never overlap (LockHeldError).
+    """
+    with FileLock(settings.SYNC_LOCK_PATH):
+        return refresh_pipeline.run(full_resync, persist=persist, on_stage=on_stage).result
+
+
+if __name__ == "__main__":
+    import sys
+
+    refresh_tasks(full_resync="--full" in sys.argv)
@@ -1,48 +1,157 @@
 import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 from src.core.config import settings
+from src.application.data_pipeline.cubes import build_cubes, save_cubes
+from src.application.data_pipeline.schema import apply_task_dtypes
+from src.application.scoring.engine import list_completion_rates
+from src.infrastructure.persistence.storage import load_frame, save_frame
+from src.infrastructure.persistence.task_store import TaskStore
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def process_data():
-    logger.info("Loading Raw Dataset")
-    data = pd.read_csv(str(settings.RAW_DATA_PATH))
-    data.loc[data['list'] == settings.DONE_LIST_NAME, 'status'] = 'Done'
-    pending_df = data[data['status'] == 'Not Done'][["list", "card", "card_id", "card_due", "card_age"]]
+# Card content that processing depends on: list, name, due, last activity and the Done transition
+FINGERPRINT_COLUMNS = ["list", "card", "card_due", "card_last_activity", "status", "done_date", "origin_list"]
+TIMESTAMP_COLUMNS = ["card_due", "card_last_activity", "done_date"]
+# Per-list aggregates are recomputed over the whole table after every patch
+AGGREGATE_COLUMNS = ["list_completion_rate"]
+NULL_HASH = np.uint64(0)
+HASH_MULTIPLIER = np.uint64(1_000_003)
 
-    logger.info("Applying Data Processing")
+def derive_status(data: pd.DataFrame) -> pd.DataFrame:
+    """Mark cards sitting in the Done list as Done and normalize timestamps to UTC."""
+    data = data.copy()
+    data.loc[data['list'] == settings.DONE_LIST_NAME, 'status'] = 'Done'
 
     # Normalize timestamp
     data['done_date'] = pd.to_datetime(data['done_date'], utc=True)
-    pending_df['card_due'] = pd.to_datetime(pending_df['card_due'], errors='coerce')
-    today = pd.Timestamp.now(tz="UTC") # tz-aware
+    data['card_due'] = pd.to_datetime(data['card_due'], errors='coerce', utc=True)
+    return data
 
-    # Task Priority Calculation
-    pending_df['days_to_due'] = (pending_df['card_due'] - today).dt.days
+def add_scoring_inputs(data: pd.DataFrame) -> pd.DataFrame:
+    """Add the per-list inputs of the priority engine."""
+    # Historical completion rate per list, an input of the priority engine
+    return data.assign(list_completion_rate=list_completion_rates(data).astype("float32"))
 
-    pending_df['priority_score'] = (
-        (pending_df['days_to_due'] + pending_df["card_age"]) / 100
-    )
-    pending_df  = pending_df.sort_values('priority_score', ascending=False)
+def _hash_column(values: pd.Series) -> np.ndarray:
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Hash each label once; code -1 (missing) picks the appended NULL_HASH
+        labels = pd.util.hash_array(values.cat.categories.to_numpy(dtype=object), categorize=False)
+        return np.append(labels, NULL_HASH)[values.cat.codes.to_numpy()]
+    if values.name in TIMESTAMP_COLUMNS:
+        # Epoch nanoseconds do not depend on the zone the timestamps are shown in
+        stamps = values if pd.api.types.is_datetime64_any_dtype(values) else pd.to_datetime(values, utc=True)
+        epoch = stamps.dt.as_unit("ns").array.asi8
+        return np.where(stamps.isna().to_numpy(), NULL_HASH, pd.util.hash_array(epoch))
+    labels = values.to_numpy(dtype=object, na_value=None)
+    return np.where(pd.isna(labels), NULL_HASH, pd.util.hash_array(labels, categorize=False))
 
-    # Apply Time Cuttoff
-    cutoff = pd.Timestamp(settings.START_DATE, tz="UTC")
-    df_done_cutoff = data[(data['status'] == 'Done') & (data['done_date'] >= cutoff)].copy()
+def card_fingerprints(data: pd.DataFrame) -> np.ndarray:
+    """
+    One uint64 content hash per card over FINGERPRINT_COLUMNS.
 
-    logger.info("Saving Processed Dataset..")
+    Equal values hash equally whatever their dtype (categorical or string
+    labels, any timestamp unit or zone), so rows read back from the task store
+    compare with rows fresh from the API.
+    """
+    fingerprints = np.zeros(len(data), dtype=np.uint64)
+    for column in FINGERPRINT_COLUMNS:
+        fingerprints = fingerprints * HASH_MULTIPLIER ^ _hash_column(data[column])
+    return fingerprints
+
+@dataclass
+class TaskDelta:
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+class IncrementalProcessor:
+    """
+    Keeps the processed task table and a content fingerprint per card between runs.
+
+    `update` only re-derives the cards that were added or whose fingerprint
+    changed, drops removed ones and patches the rest in place. `dirty` tells
+    whether the table differs from what is on disk.
+    """
+
+    def __init__(self, path: str | Path | None = None, cubes_dir: str | Path | None = None):
+        self.path = Path(path or settings.TASKS_DATA_PATH)
+        self.cubes_dir = Path(cubes_dir or settings.CUBES_DIR)
+        self.tasks: pd.DataFrame | None = None
+        self.dirty = False
+        self.last_delta = TaskDelta()
 
-    # Save Done Dataset
-    df_done_cutoff.to_csv(str(settings.DONE_DATA_PATH), index=True, encoding="utf-8")
+    def _previous(self) -> pd.DataFrame | None:
+        if self.tasks is None and self.path.exists():
+            self.tasks = load_frame(self.path).drop(columns=AGGREGATE_COLUMNS, errors="ignore")
+        return self.tasks
 
-    # Save Pending Dataset
-    pending_df.to_csv(str(settings.PENDING_DATA_PATH), index=True, encoding="utf-8")
+    def update(self, data: pd.DataFrame) -> pd.DataFrame:
+        data = apply_task_dtypes(data)
+        fingerprints = card_fingerprints(data)
+        previous = self._previous()
 
-    # Save All Data
-    df_full = data.copy()
-    df_full.to_csv(str(settings.ALL_DATA_PATH), index=True, encoding="utf-8")
+        if previous is None:
+            self.tasks = derive_status(data).assign(fingerprint=fingerprints)
+            self.last_delta = TaskDelta(added=len(data))
+            self.dirty = True
+            return self.tasks
+
+        positions = pd.Index(previous["card_id"]).get_indexer(data["card_id"])
+        known = positions >= 0
+        stale = previous["fingerprint"].to_numpy()[positions[known]] != fingerprints[known]
+        changed = ~known
+        changed[known] = stale
+        removed = pd.Index(data["card_id"]).get_indexer(previous["card_id"]) < 0
+
+        self.last_delta = TaskDelta(added=int((~known).sum()), changed=int(stale.sum()), removed=int(removed.sum()))
+        logger.info(
+            f"{self.last_delta.added} added, {self.last_delta.changed} changed "
+            f"and {self.last_delta.removed} removed card(s) to reprocess"
+        )
+        if not self.last_delta:
+            return previous
+
+        patched = derive_status(data[changed]).assign(fingerprint=fingerprints[changed])
+        keep = ~removed
+        keep[positions[changed & known]] = False
+        kept = previous[keep]
+        self.tasks = apply_task_dtypes(pd.concat([kept, patched], ignore_index=True))
+        self.dirty = True
+        return self.tasks
+
+    def save(self, data: pd.DataFrame) -> None:
+        """Write `data` (the scored table) and its aggregate cubes if anything changed since the last write."""
+        if not self.dirty:
+            logger.info("No card changes; processed dataset left as is")
+            return
+        save_frame(data, self.path)
+        save_cubes(build_cubes(data), self.cubes_dir)
+        self.dirty = False
+
+def process_data(data: pd.DataFrame | None = None) -> pd.DataFrame:
+    if data is None:
+        logger.info("Loading Raw Dataset")
+        data = TaskStore().all()
+
+    logger.info("Applying Data Processing")
+    processor = IncrementalProcessor()
+    data = add_scoring_inputs(processor.update(data))
+
+    # Done and pending subsets are views over this table (see views.py), not separate files;
+    # the dashboard's aggregate cubes are written next to it (see cubes.py)
+    logger.info("Saving Processed Dataset..")
+    processor.save(data)
 
     logger.info("Saved Sucessfully")
+    return data
 
 if __name__ == "__main__":
     process_data()
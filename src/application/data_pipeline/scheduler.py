@@ -0,0 +1,138 @@
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from src.core.config import settings
+from src.application.data_pipeline.pipeline import refresh_tasks
+from src.infrastructure.persistence.file_lock import LockHeldError
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# (name, lowest, highest) of the five cron fields
+CRON_FIELDS = [("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7)]
+MAX_SEARCH_DAYS = 366 * 5
+MAX_SLEEP = 60  # seconds; re-check the clock at least this often
+
+
+def _parse_field(text: str, lowest: int, highest: int) -> frozenset[int]:
+    values = set()
+    for part in text.split(","):
+        span, _, step = part.partition("/")
+        if span == "*":
+            start, end = lowest, highest
+        elif "-" in span:
+            start, end = (int(bound) for bound in span.split("-", 1))
+        else:
+            start = int(span)
+            end = highest if step else start
+        if not lowest <= start <= end <= highest:
+            raise ValueError(f"Cron field '{text}' is outside {lowest}-{highest}")
+        values.update(range(start, end + 1, int(step or 1)))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """A standard five-field cron expression (minute hour day-of-month month day-of-week)."""
+
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    any_day: bool
+    any_weekday: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        fields = expression.split()
+        if len(fields) != len(CRON_FIELDS):
+            raise ValueError(f"Expected {len(CRON_FIELDS)} cron fields, got '{expression}'")
+        values = [_parse_field(text, low, high) for text, (_, low, high) in zip(fields, CRON_FIELDS)]
+        # Both 0 and 7 mean Sunday
+        values[4] = frozenset(value % 7 for value in values[4])
+        return cls(*values, any_day=fields[2] == "*", any_weekday=fields[4] == "*")
+
+    def _matches_day(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        # Like cron: when both day fields are restricted, either one may match
+        if not self.any_day and not self.any_weekday:
+            return day or weekday
+        return day and weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """First matching minute strictly after `moment`."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=MAX_SEARCH_DAYS)
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError("Cron schedule never matches")
+
+
+def run_with_retries(
+    job: Callable[[], object] = refresh_tasks,
+    retries: int = settings.SYNC_MAX_RETRIES,
+    base_delay: float = settings.SYNC_RETRY_BASE_DELAY,
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    """
+    Run `job`, retrying failures with full-jitter exponential backoff.
+
+    Returns whether it succeeded. A held lock means another refresh is
+    already running, so that attempt is skipped rather than retried.
+    """
+    for attempt in range(retries + 1):
+        try:
+            job()
+            return True
+        except LockHeldError as e:
+            logger.warning(f"Skipping refresh: {e}")
+            return False
+        except Exception:
+            if attempt == retries:
+                logger.exception(f"Refresh failed after {retries + 1} attempt(s)")
+                return False
+            delay = random.uniform(0, base_delay * 2 ** attempt)
+            logger.warning(f"Refresh attempt {attempt + 1} failed; retrying in {delay:.0f}s", exc_info=True)
+            sleep(delay)
+    return False
+
+
+def sleep_until(moment: datetime) -> None:
+    # Short naps keep the wake-up on time across clock changes and suspends
+    while (remaining := (moment - datetime.now()).total_seconds()) > 0:
+        time.sleep(min(remaining, MAX_SLEEP))
+
+
+def serve(schedule: str = settings.SYNC_SCHEDULE, run_now: bool = False) -> None:
+    """Refresh the task data on `schedule` (local time) until interrupted."""
+    cron = CronSchedule.parse(schedule)
+    if run_now:
+        run_with_retries()
+    while True:
+        due = cron.next_after(datetime.now())
+        logger.info(f"Next scheduled refresh at {due:%Y-%m-%d %H:%M}")
+        sleep_until(due)
+        run_with_retries()
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--once" in sys.argv:
+        sys.exit(0 if run_with_retries() else 1)
+    serve(run_now="--now" in sys.argv)
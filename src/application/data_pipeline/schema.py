@@ -0,0 +1,62 @@
+import logging
+
+import pandas as pd
+
+from src.core.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATUS_VALUES = ["Done", "Not Done"]
+
+# Low-cardinality labels become categoricals, free text becomes Arrow-backed strings
+TASK_DTYPES = {
+    "list": "category",
+    "origin_list": "category",
+    "status": pd.CategoricalDtype(STATUS_VALUES),
+    "card": "string[pyarrow]",
+    "card_id": "string[pyarrow]",
+}
+INTEGER_COLUMNS = ["card_age"]
+
+
+def apply_task_dtypes(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return `data` with the compact task schema applied to the columns it has.
+
+    Safe to call on frames that already use the schema.
+    """
+    dtypes = {column: dtype for column, dtype in TASK_DTYPES.items() if column in data.columns}
+    data = data.astype(dtypes)
+    for column in INTEGER_COLUMNS:
+        if column in data.columns and not data[column].isna().any():
+            data[column] = pd.to_numeric(data[column], downcast="integer")
+    return data
+
+
+def memory_report(data: pd.DataFrame) -> pd.DataFrame:
+    """Per-column deep memory of `data` as plain object/int64 columns versus the compact schema."""
+    plain = data.astype({
+        column: object for column in data.columns
+        if isinstance(data[column].dtype, (pd.CategoricalDtype, pd.StringDtype))
+    })
+    for column in INTEGER_COLUMNS:
+        if column in plain.columns and not plain[column].isna().any():
+            plain[column] = plain[column].astype("int64")
+    compact = apply_task_dtypes(data)
+
+    report = pd.DataFrame({
+        "before_bytes": plain.memory_usage(deep=True, index=False),
+        "after_bytes": compact.memory_usage(deep=True, index=False),
+    })
+    report.loc["total"] = report.sum()
+    report["ratio"] = (report["before_bytes"] / report["after_bytes"]).round(2)
+    return report
+
+
+if __name__ == "__main__":
+    from src.application.data_pipeline.views import load_tasks
+
+    tasks = load_tasks()
+    logger.info(f"Memory report for {len(tasks)} tasks in {settings.TASKS_DATA_PATH}")
+    print(memory_report(tasks).to_string())
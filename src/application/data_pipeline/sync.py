@@ -0,0 +1,176 @@
+import json
+import logging
+
+import pandas as pd
+
+from src.core.config import settings
+from src.infrastructure.persistence.task_store import TaskStore
+from src.application.data_pipeline.fetcher import (
+    Board_ID,
+    apply_done_transitions,
+    build_task_frame,
+    fetch_cards_by_id,
+    fetch_cards_by_list,
+    fetch_data,
+    fetch_lists,
+    FirstDoneMoves,
+    iter_action_pages,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Actions that take a card off the board entirely
+REMOVAL_ACTIONS = {"deleteCard", "moveCardFromBoard"}
+# Re-read this much history before the watermark, in case an action landed late; upserts are idempotent
+WATERMARK_OVERLAP = pd.Timedelta(minutes=1)
+
+
+def _iso(timestamp: pd.Timestamp) -> str:
+    return timestamp.isoformat().replace("+00:00", "Z")
+
+
+def load_sync_state() -> dict | None:
+    path = settings.SYNC_STATE_PATH
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_sync_state(last_action_date: str | None, last_card_activity: pd.Timestamp | None) -> None:
+    state = {
+        "board_id": Board_ID,
+        "last_action_date": last_action_date,
+        "last_card_activity": None if pd.isna(last_card_activity) else _iso(last_card_activity),
+    }
+    with open(settings.SYNC_STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+def _watermark(state: dict) -> str | None:
+    # Both marks are Trello timestamps, never the local clock. Every card action also
+    # bumps dateLastActivity, so the later of the two is safe
+    marks = [pd.Timestamp(mark) for mark in (state.get("last_action_date"), state.get("last_card_activity")) if mark]
+    return _iso(max(marks) - WATERMARK_OVERLAP) if marks else None
+
+
+def resolve_card_deltas(
+    previous: pd.DataFrame,
+    changed: pd.DataFrame,
+    transitions: pd.DataFrame,
+    list_names: set[str],
+) -> pd.DataFrame:
+    """Return the rows to upsert for `changed` cards, given their stored `previous` rows."""
+    # Cards already Done keep their first Done transition; the rest take any new one
+    previous = previous[previous["status"] == "Done"].set_index("card_id")
+    carried = changed["card_id"].isin(previous.index)
+    for column in ["status", "done_date", "origin_list"]:
+        changed.loc[carried, column] = changed.loc[carried, "card_id"].map(previous[column])
+
+    fresh = apply_done_transitions(changed[~carried], transitions, list_names)
+    return pd.concat([changed[carried], fresh], ignore_index=True)
+
+
+def incremental_sync(state: dict, store: TaskStore) -> tuple[str | None, pd.Timestamp | None]:
+    """
+    Apply board changes since the watermark to `store`.
+
+    Returns the date of the newest action seen and the newest card activity,
+    each falling back to the stored mark when nothing newer came back.
+    """
+    since = _watermark(state)
+    logger.info(f"Fetching Trello changes since {since}..")
+
+    lists = fetch_lists()
+    list_map = {lst["id"]: lst["name"] for lst in lists}
+
+    touched_ids: set[str] = set()
+    removed_ids: set[str] = set()
+    list_ids: set[str] = set()
+    transitions = FirstDoneMoves()
+    last_action_date = state.get("last_action_date")
+    for page in iter_action_pages(since=since, action_filter=None):
+        newest = max(pd.Timestamp(action["date"]) for action in page)
+        if last_action_date is None or newest > pd.Timestamp(last_action_date):
+            last_action_date = _iso(newest)
+        for action in page:
+            data = action.get("data", {})
+            card_id = data.get("card", {}).get("id")
+            if not card_id:
+                # List-level actions (renames, archiving, moves between boards) change every card on the list
+                list_id = data.get("list", {}).get("id")
+                if list_id:
+                    list_ids.add(list_id)
+                continue
+            if action.get("type") in REMOVAL_ACTIONS:
+                removed_ids.add(card_id)
+            else:
+                touched_ids.add(card_id)
+        transitions.add(page)
+
+    # Cards of lists still open on the board are re-read with them; cards of lists
+    # archived or moved away drop off the board, as they would in a full download
+    listed = {}
+    for list_id, list_cards in zip(list_ids, fetch_cards_by_list(list(list_ids))):
+        if list_cards is None:
+            logger.warning(f"Could not read the cards of list {list_id}; they keep their stored list")
+        elif list_id in list_map:
+            listed.update((card["id"], card) for card in list_cards if card["id"] not in removed_ids)
+        else:
+            removed_ids.update(card["id"] for card in list_cards)
+
+    candidate_ids = list(touched_ids - removed_ids - listed.keys())
+    cards = list(listed.values())
+    for card_id, card in zip(candidate_ids, fetch_cards_by_id(candidate_ids)):
+        if card is None or card.get("closed") or card.get("idBoard") != Board_ID:
+            removed_ids.add(card_id)
+        else:
+            cards.append(card)
+
+    logger.info(f"{len(cards)} changed and {len(removed_ids)} removed card(s)")
+    changed = build_task_frame(cards, list_map)
+    changed = resolve_card_deltas(
+        store.by_ids(changed["card_id"]), changed, transitions.frame(), set(list_map.values())
+    )
+    store.upsert(changed)
+    store.delete(removed_ids)
+
+    last_activity = changed["card_last_activity"].max()
+    previous_mark = state.get("last_card_activity")
+    if previous_mark and (pd.isna(last_activity) or pd.Timestamp(previous_mark) > last_activity):
+        last_activity = pd.Timestamp(previous_mark)
+    return last_action_date, last_activity
+
+
+def sync_data(full_resync: bool = False) -> pd.DataFrame:
+    """
+    Bring the task store up to date with the board.
+
+    After a first full download, only actions newer than the stored watermark
+    and the cards they touched are requested, and upserted row by row.
+    Pass `full_resync=True` to discard the watermark and download everything.
+    Returns the synced task table.
+    """
+    store = TaskStore()
+    state = None if full_resync else load_sync_state()
+    if state and (state.get("board_id") != Board_ID or store.count() == 0):
+        state = None
+
+    if state is None:
+        # The full download reads only list moves, so the newest card activity is the watermark
+        data = fetch_data()
+        last_action_date, last_card_activity = None, data["card_last_activity"].max()
+    else:
+        last_action_date, last_card_activity = incremental_sync(state, store)
+        data = store.all()
+
+    save_sync_state(last_action_date, last_card_activity)
+    logger.info("Sync is Done!")
+    return data
+
+
+if __name__ == "__main__":
+    import sys
+
+    sync_data(full_resync="--full" in sys.argv)
@@ -0,0 +1,105 @@
+from datetime import date
+
+import pandas as pd
+
+from src.core.config import settings
+from src.application.data_pipeline.dataset_cache import dataset_cache
+from src.application.data_pipeline.schema import apply_task_dtypes
+from src.application.scoring.engine import score_tasks
+from src.infrastructure.persistence.storage import load_frame
+
+# Pushed down to the Parquet reader when only pending rows are needed
+PENDING_FILTERS = [("status", "==", "Not Done")]
+
+# Relative columns and the absolute timestamps they are derived from
+RELATIVE_SOURCES = {"card_age": "card_last_activity", "days_to_due": "card_due"}
+
+
+def utc_today() -> date:
+    return pd.Timestamp.now(tz="UTC").date()
+
+
+def add_relative_columns(tasks: pd.DataFrame, day: date) -> pd.DataFrame:
+    """
+    Derive `card_age` and `days_to_due` as whole days relative to the start of `day` (UTC).
+
+    Only absolute timestamps are persisted, so these never go stale on disk.
+    Ages count calendar days, so a card touched earlier today is 0 days old.
+    """
+    today = pd.Timestamp(day, tz="UTC")
+    relative = {}
+    if "card_last_activity" in tasks.columns:
+        relative["card_age"] = (today - tasks["card_last_activity"].dt.normalize()).dt.days.clip(lower=0)
+    if "card_due" in tasks.columns:
+        relative["days_to_due"] = (tasks["card_due"] - today).dt.days
+    return tasks.assign(**relative)
+
+
+def tasks_version() -> int | None:
+    """Data-version token of the processed task table (its mtime), None before the first refresh."""
+    try:
+        return settings.TASKS_DATA_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@dataset_cache.dataset("tasks", version=tasks_version, max_entries=16)
+def _load_tasks_for_day(day: date, columns: tuple | None, filters: tuple | None) -> pd.DataFrame:
+    tasks = load_frame(
+        settings.TASKS_DATA_PATH,
+        columns=list(columns) if columns else None,
+        filters=list(filters) if filters else None,
+    )
+    return apply_task_dtypes(add_relative_columns(tasks, day))
+
+
+def load_tasks(
+    columns: list[str] | None = None,
+    filters: list[tuple] | None = None,
+    day: date | None = None,
+) -> pd.DataFrame:
+    """
+    Read the canonical task table written by `process_data`, in the compact schema.
+
+    Relative columns are added for `day` (today by default). Results live in the
+    shared dataset cache per calendar day and file version, so treat the
+    returned frame as read-only.
+    """
+    if columns is not None:
+        columns = [RELATIVE_SOURCES.get(column, column) for column in columns]
+        columns = tuple(dict.fromkeys(columns))
+    return _load_tasks_for_day(day or utc_today(), columns, tuple(filters) if filters else None)
+
+
+def done_mask(tasks: pd.DataFrame, cutoff: pd.Timestamp | None = None) -> pd.Series:
+    cutoff = cutoff if cutoff is not None else pd.Timestamp(settings.START_DATE, tz="UTC")
+    return (tasks["status"] == "Done") & (tasks["done_date"] >= cutoff)
+
+
+def pending_mask(tasks: pd.DataFrame) -> pd.Series:
+    return tasks["status"] == "Not Done"
+
+
+def done_view(tasks: pd.DataFrame, cutoff: pd.Timestamp | None = None) -> pd.DataFrame:
+    """Tasks completed on or after `cutoff` (defaults to settings.START_DATE)."""
+    return tasks[done_mask(tasks, cutoff)]
+
+
+def pending_view(tasks: pd.DataFrame) -> pd.DataFrame:
+    """Not-done tasks with `priority_score` added, highest priority first."""
+    pending = tasks[pending_mask(tasks)] if "status" in tasks.columns else tasks
+    if "days_to_due" not in pending.columns:
+        pending = add_relative_columns(pending, utc_today())
+
+    pending = pending.assign(priority_score=score_tasks(pending))
+    return pending.sort_values("priority_score", ascending=False)
+
+
+@dataset_cache.dataset("pending", version=tasks_version, depends_on=("tasks",))
+def _load_pending_for_day(day: date, columns: tuple | None) -> pd.DataFrame:
+    return pending_view(load_tasks(columns=list(columns) if columns else None, filters=PENDING_FILTERS, day=day))
+
+
+def load_pending(columns: list[str] | None = None, day: date | None = None) -> pd.DataFrame:
+    """Scored pending tasks, highest priority first; shared and read-only like `load_tasks`."""
+    return _load_pending_for_day(day or utc_today(), tuple(columns) if columns else None)
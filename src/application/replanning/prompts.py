@@ -11,9 +11,9 @@ You will receive:
    - list
    - card
    - card_due
-   - card_age
-   - days_to_due
-   - priority_score
+   - card_age (days since last activity)
+   - days_to_due (negative when overdue)
+   - priority_score (higher = more urgent; rows arrive sorted by it)
 2) A natural-language user instruction with desired scheduling changes.
 3) Today's date.
 
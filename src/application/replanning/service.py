@@ -7,6 +7,7 @@ from langchain_core.output_parsers import JsonOutputParser
 
 from src.application.replanning.prompts import replanner_system_prompt, replanner_user_prompt
 from src.domain.models.replanning import ReplanResult
+from src.infrastructure.cache.results import cached_result
 
 # Try to find app.env in the project root
 ROOT_DIR = Path(__file__).parent.parent.parent.parent
@@ -51,7 +52,22 @@ def _build_llm(provider: str):
     raise ValueError("Unsupported provider. Use 'gemini' or 'mistral'.")
 
 
-def generate_replan_dataset(csv_data: str, user_instruction: str, provider: str = "gemini"):
+def generate_replan_dataset(csv_data: str, user_instruction: str, provider: str = "gemini", use_cache: bool = True):
+    inputs = {
+        "today_date": str(date.today()),
+        "csv_data": csv_data,
+        "user_instruction": user_instruction,
+        "format_instructions": replanner_parser.get_format_instructions(),
+    }
+    return cached_result(
+        f"llm:replan:{provider.lower().strip()}",
+        inputs,
+        lambda: _invoke_replanner(provider, inputs),
+        use_cache=use_cache,
+    )
+
+
+def _invoke_replanner(provider: str, inputs: dict):
     llm = _build_llm(provider)
     chat_prompt = ChatPromptTemplate.from_messages(
         [
@@ -65,11 +81,4 @@ def generate_replan_dataset(csv_data: str, user_instruction: str, provider: str
 
     chain = chat_prompt | llm | replanner_parser
 
-    return chain.invoke(
-        {
-            "today_date": str(date.today()),
-            "csv_data": csv_data,
-            "user_instruction": user_instruction,
-            "format_instructions": replanner_parser.get_format_instructions(),
-        }
-    )
+    return chain.invoke(inputs)
@@ -0,0 +1,126 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from src.core.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+Scorer = Callable[[pd.DataFrame], np.ndarray]
+
+
+@dataclass
+class RegisteredScorer:
+    name: str
+    weight: float
+    func: Scorer
+
+
+@dataclass
+class PriorityEngine:
+    """
+    Weighted sum of priority scorers, evaluated as whole-array NumPy operations.
+
+    Each scorer maps a frame of pending tasks to one float per row, roughly in
+    [0, 1] with higher meaning "do this sooner". Missing inputs score 0.
+    """
+
+    scorers: dict[str, RegisteredScorer] = field(default_factory=dict)
+
+    def register(self, name: str, weight: float = 1.0) -> Callable[[Scorer], Scorer]:
+        def decorator(func: Scorer) -> Scorer:
+            self.scorers[name] = RegisteredScorer(name, weight, func)
+            return func
+        return decorator
+
+    def breakdown(self, tasks: pd.DataFrame) -> pd.DataFrame:
+        """Weighted contribution of every scorer, one column per scorer."""
+        return pd.DataFrame(
+            {
+                name: scorer.weight * np.nan_to_num(np.asarray(scorer.func(tasks), dtype=np.float64))
+                for name, scorer in self.scorers.items()
+            },
+            index=tasks.index,
+        )
+
+    def score(self, tasks: pd.DataFrame) -> np.ndarray:
+        total = np.zeros(len(tasks), dtype=np.float64)
+        for scorer in self.scorers.values():
+            total += scorer.weight * np.nan_to_num(np.asarray(scorer.func(tasks), dtype=np.float64))
+        return total
+
+
+def _days(tasks: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in tasks.columns:
+        return np.full(len(tasks), np.nan)
+    return tasks[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def list_completion_rates(tasks: pd.DataFrame) -> pd.Series:
+    """
+    Share of each list's tasks that were completed, mapped onto every row by `list`.
+
+    Done tasks count toward the list they came from (`origin_list`), pending
+    tasks toward the list they sit in.
+    """
+    done = tasks["status"] == "Done"
+    owner = tasks["list"].astype(object).where(~done, tasks["origin_list"].astype(object))
+    codes, lists = pd.factorize(owner)
+    valid = codes >= 0
+    totals = np.bincount(codes[valid], minlength=len(lists))
+    completed = np.bincount(codes[valid], weights=done.to_numpy()[valid], minlength=len(lists))
+    rates = np.divide(completed, totals, out=np.zeros(len(lists)), where=totals > 0)
+
+    row_codes = pd.Index(lists).get_indexer(tasks["list"].astype(object))
+    return pd.Series(np.where(row_codes >= 0, rates[row_codes], np.nan), index=tasks.index)
+
+
+priority_engine = PriorityEngine()
+weights = settings.PRIORITY_WEIGHTS
+
+
+@priority_engine.register("overdue", weights["overdue"])
+def overdue_escalation(tasks: pd.DataFrame) -> np.ndarray:
+    """Rises toward 1 as the due date nears and keeps growing (log) once overdue."""
+    days_to_due = _days(tasks, "days_to_due")
+    upcoming = 1.0 / (1.0 + np.clip(days_to_due, 0, None))
+    overdue = 1.0 + np.log1p(np.clip(-days_to_due, 0, None))
+    return np.where(days_to_due < 0, overdue, upcoming)
+
+
+@priority_engine.register("list_size", weights["list_size"])
+def list_size_pressure(tasks: pd.DataFrame) -> np.ndarray:
+    """Tasks in crowded lists score higher (pending count of the list / largest list)."""
+    if "list" not in tasks.columns or tasks.empty:
+        return np.zeros(len(tasks))
+    codes, _ = pd.factorize(tasks["list"])
+    counts = np.bincount(codes[codes >= 0])
+    pressure = counts[np.clip(codes, 0, None)] / counts.max()
+    return np.where(codes >= 0, pressure, 0.0)
+
+
+@priority_engine.register("aging", weights["aging"])
+def aging_decay(tasks: pd.DataFrame) -> np.ndarray:
+    """Old tasks without a near due date surface: 1 - exp(-age / OLD_TASK_AGE), damped by urgency."""
+    age = _days(tasks, "card_age")
+    days_to_due = _days(tasks, "days_to_due")
+    staleness = 1.0 - np.exp(-np.clip(age, 0, None) / settings.OLD_TASK_AGE)
+    # Tasks already pressed by a close deadline are handled by the overdue scorer
+    not_urgent = np.where(np.isnan(days_to_due), 1.0, np.clip(days_to_due / settings.OLD_TASK_AGE, 0, 1))
+    return staleness * not_urgent
+
+
+@priority_engine.register("completion_rate", weights["completion_rate"])
+def neglected_list_boost(tasks: pd.DataFrame) -> np.ndarray:
+    """Lists with a low historical completion rate get a boost (1 - rate)."""
+    rates = _days(tasks, "list_completion_rate")
+    return 1.0 - rates
+
+
+def score_tasks(tasks: pd.DataFrame) -> pd.Series:
+    """Priority score of every row in `tasks`, higher first."""
+    return pd.Series(priority_engine.score(tasks), index=tasks.index)
@@ -14,9 +14,9 @@ You will receive:
 * `list`: The Trello list/category the task belongs to
 * `card`: The task name/description
 * `card_due`: The due date of the task (if any)
-* `card_age`
-* `days_to_due`
-* `priority_score`
+* `card_age`: Days since the task was last touched
+* `days_to_due`: Days until the due date (negative when overdue)
+* `priority_score`: Precomputed urgency, higher means more urgent (rows arrive sorted by it)
 * Additional columns may include labels, priority, complexity, etc.
 
 2. **User Context Notes (Optional)**
@@ -7,6 +7,7 @@ from langchain_core.output_parsers import JsonOutputParser
 from src.core.config import settings
 from src.application.task_generation.prompts import system_prompt, user_prompt
 from src.domain.models.task_generation import DailyTaskPlan
+from src.infrastructure.cache.results import cached_result
 
 # Try to find app.env in the project root
 ROOT_DIR = Path(__file__).parent.parent.parent.parent
@@ -29,13 +30,17 @@ chat_prompt = ChatPromptTemplate.from_messages([
 
 chain = chat_prompt | llm | parser
 
-def generate_daily_tasks(csv_data, user_notes: str = "None", user_goals: str = "None", analytics_summary: str = "None" , include_reasoning:bool = False):
-    response =  chain.invoke({
+def generate_daily_tasks(csv_data, user_notes: str = "None", user_goals: str = "None", analytics_summary: str = "None" , include_reasoning:bool = False, use_cache: bool = True):
+    inputs = {
         "csv_data": csv_data,
         "user_notes": user_notes,
         "user_goals": user_goals,
         "analytics_summary": analytics_summary,
         "include_reasoning": "Yes, provide detailed reasoning" if include_reasoning else "No, skip reasoning",
         "format_instructions": parser.get_format_instructions()
-        })
+        }
+    # Identical requests reuse the stored plan (shared across app replicas); use_cache=False asks for a new one
+    response = cached_result(
+        f"llm:daily_tasks:{settings.MODEL}", inputs, lambda: chain.invoke(inputs), use_cache=use_cache
+    )
     return response
@@ -1,7 +1,7 @@
 import pandas as pd
 import random
 from datetime import datetime, timedelta
-from src.core.config import settings
+from src.application.data_pipeline.views import load_tasks, pending_view
 
 def assign_random_due_dates(tasks_df):
     for index, row in tasks_df.iterrows():
@@ -11,5 +11,5 @@ def assign_random_due_dates(tasks_df):
     return tasks_df
 
 if __name__ == "__main__":
-    tasks = pd.read_csv(str(settings.PENDING_DATA_PATH))
+    tasks = pending_view(load_tasks())
     print(assign_random_due_dates(tasks).sample(5) if len(tasks) >= 5 else assign_random_due_dates(tasks))
@@ -10,13 +10,46 @@ def user_goals(md_path):
 class Settings():
     MODEL = "gemini-3-flash-preview"
     DATA_DIR = ROOT_DIR / "Infrastructure" / "persistence" / "data"
-    RAW_DATA_PATH = DATA_DIR / "raw" / "raw.csv"
-    PENDING_DATA_PATH = DATA_DIR / "processed" / "pending.csv"
-    ALL_DATA_PATH = DATA_DIR / "processed" / "full.csv"
-    DONE_DATA_PATH = DATA_DIR / "processed" / "done.csv"
+    TASK_DB_PATH = DATA_DIR / "raw" / "tasks.sqlite3"
+    SYNC_STATE_PATH = DATA_DIR / "raw" / "sync_state.json"
+    SYNC_LOCK_PATH = DATA_DIR / "raw" / "sync.lock"
+    TASKS_DATA_PATH = DATA_DIR / "processed" / "tasks.parquet"
+    # Pre-aggregated counts the dashboard slices instead of scanning task rows
+    CUBES_DIR = DATA_DIR / "processed" / "cubes"
     START_DATE = "2025-10-05"
     DONE_LIST_NAME = "Done"
     OLD_TASK_AGE = 30
+    # Weights of the registered priority scorers (src/application/scoring/engine.py)
+    PRIORITY_WEIGHTS = {
+        "overdue": 0.4,
+        "list_size": 0.15,
+        "aging": 0.3,
+        "completion_rate": 0.15,
+    }
+    TRELLO_CONNECT_TIMEOUT = 5  # seconds
+    TRELLO_READ_TIMEOUT = 30  # seconds
+    TRELLO_POOL_SIZE = 8
+    # Calendar due-date edits: last write per card wins within the window, then at most
+    # this many card updates run at once
+    CALENDAR_WRITE_WINDOW = 1.5  # seconds
+    CALENDAR_WRITE_CONCURRENCY = 4
+    # Unattended refresh (minute hour day-of-month month day-of-week, local time)
+    SYNC_SCHEDULE = "0 2 * * *"
+    SYNC_MAX_RETRIES = 3
+    SYNC_RETRY_BASE_DELAY = 30  # seconds
+    # Shared cache for datasets and LLM results: "memory" (per process), "disk" (memory-mapped
+    # Arrow files, shared by every process on the host) or "redis" (shared across hosts)
+    CACHE_BACKEND = "memory"
+    CACHE_DIR = DATA_DIR / "cache"
+    CACHE_REDIS_URL = "redis://localhost:6379/0"
+    LLM_CACHE_TTL = 6 * 60 * 60  # seconds
+    # Dashboard results memoized per (data version, filters), least recently used evicted first
+    DASHBOARD_MEMO_ENTRIES = 32
+    DASHBOARD_MEMO_MAX_BYTES = 256 * 1024 * 1024
+    DASHBOARD_FIGURE_ENTRIES = 160  # about 16 filter sets of every dashboard chart
+    # Time series switch to weekly, then monthly buckets beyond this many points
+    DASHBOARD_MAX_POINTS = 400
+    DASHBOARD_HEATMAP_MAX_DAYS = 2 * 366  # longer calendar heatmaps show months instead of days
     GOALS = user_goals(ROOT_DIR / "goals.md")
 
 
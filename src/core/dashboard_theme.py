@@ -2,6 +2,8 @@
 
 Edit values here to update the dashboard color palette globally.
 """
+import hashlib
+import json
 
 DASHBOARD_COLORS = {
     "categorical": [
@@ -32,3 +34,6 @@ DASHBOARD_COLORS = {
         "grid": "gray",
     },
 }
+
+# Part of the dashboard's figure cache key, so edited colors never serve stale figures
+DASHBOARD_THEME_KEY = hashlib.sha256(json.dumps(DASHBOARD_COLORS, sort_keys=True).encode("utf-8")).hexdigest()[:16]
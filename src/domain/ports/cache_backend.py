@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class CacheBackend(ABC):
+    """
+    Key-value store for cached datasets and LLM results.
+
+    Values are DataFrames or JSON-serializable objects. `get` returns None on
+    a miss or after the entry's `ttl` (seconds) has passed.
+    """
+
+    # Whether entries are visible to other processes (replicas)
+    shared: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+from src.core.config import settings
+from src.domain.ports.cache_backend import CacheBackend
+
+KEY_PREFIX = "smart-tasking:"
+EXPIRY_METADATA = b"expires_at"
+FRAME_TAG, JSON_TAG = b"A", b"J"
+# Arrow strings come back as Arrow-backed pandas strings, matching the compact task schema
+STRING_TYPES = {pa.string(): pd.StringDtype("pyarrow"), pa.large_string(): pd.StringDtype("pyarrow")}
+
+
+def _expires_at(ttl: float | None) -> float | None:
+    return time.time() + ttl if ttl else None
+
+
+def _expired(expires_at: float | None) -> bool:
+    return expires_at is not None and expires_at <= time.time()
+
+
+def encode(value: Any) -> bytes:
+    """DataFrames as an Arrow IPC stream, anything else as JSON; the first byte says which."""
+    if isinstance(value, pd.DataFrame):
+        sink = pa.BufferOutputStream()
+        table = pa.Table.from_pandas(value)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return FRAME_TAG + sink.getvalue().to_pybytes()
+    return JSON_TAG + json.dumps(value, default=str).encode("utf-8")
+
+
+def decode(blob: bytes) -> Any:
+    tag, payload = blob[:1], blob[1:]
+    if tag == FRAME_TAG:
+        return pa.ipc.open_stream(payload).read_all().to_pandas(types_mapper=STRING_TYPES.get)
+    return json.loads(payload)
+
+
+class InProcessBackend(CacheBackend):
+    """Plain dictionary in this process; values are stored as-is, never serialized."""
+
+    def __init__(self):
+        self._entries: dict[str, tuple[Any, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            value, expires_at = self._entries.get(key, (None, None))
+            if _expired(expires_at):
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        with self._lock:
+            self._entries[key] = (value, _expires_at(ttl))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class ArrowDiskBackend(CacheBackend):
+    """
+    Files in a shared directory: DataFrames as Arrow IPC files read through a
+    memory map, other values as JSON.
+
+    Every process on the host reads the same file, so a dataset is parsed from
+    its source once. Each reader still converts it into its own pandas frame.
+    """
+
+    shared = True
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory or settings.CACHE_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}{suffix}"
+
+    def _write(self, path: Path, write) -> None:
+        partial = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            write(partial)
+            os.replace(partial, path)
+        finally:
+            partial.unlink(missing_ok=True)
+
+    def get(self, key: str) -> Any | None:
+        """
+        Stored value for `key`, or None. Arrow files are memory-mapped, but
+        `to_pandas()` copies their columns into this process.
+        """
+        frame_path, json_path = self._path(key, ".arrow"), self._path(key, ".json")
+        if frame_path.exists():
+            try:
+                table = pa.ipc.open_file(pa.memory_map(str(frame_path))).read_all()
+            except (FileNotFoundError, pa.ArrowInvalid):
+                return None
+            expires_at = (table.schema.metadata or {}).get(EXPIRY_METADATA)
+            if expires_at and _expired(float(expires_at)):
+                self.delete(key)
+                return None
+            return table.to_pandas(types_mapper=STRING_TYPES.get)
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if _expired(entry["expires_at"]):
+            self.delete(key)
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires_at = _expires_at(ttl)
+        if isinstance(value, pd.DataFrame):
+            table = pa.Table.from_pandas(value)
+            if expires_at:
+                table = table.replace_schema_metadata({**table.schema.metadata, EXPIRY_METADATA: str(expires_at)})
+
+            def write(path: Path) -> None:
+                with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            self._write(self._path(key, ".arrow"), write)
+            return
+
+        def write(path: Path) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": expires_at, "value": value}, f, default=str)
+        self._write(self._path(key, ".json"), write)
+
+    def delete(self, key: str) -> None:
+        for suffix in (".arrow", ".json"):
+            self._path(key, suffix).unlink(missing_ok=True)
+
+
+class RedisBackend(CacheBackend):
+    """Any client with Redis' get / set(ex=) / delete, e.g. redis.Redis or LocalRedis."""
+
+    shared = True
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            import redis
+        except ImportError as exc:
+            raise ImportError(
+                "redis is required for the Redis cache backend. Install it with: pip install redis"
+            ) from exc
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Any | None:
+        blob = self.client.get(KEY_PREFIX + key)
+        return None if blob is None else decode(blob)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.client.set(KEY_PREFIX + key, encode(value), ex=max(1, int(ttl)) if ttl else None)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(KEY_PREFIX + key)
+
+
+class LocalRedis:
+    """
+    In-memory stand-in for a Redis client (get / set(ex=) / delete on bytes).
+
+    Lets RedisBackend, including its serialization, run in tests and local
+    development without a server.
+    """
+
+    def __init__(self):
+        self._backend = InProcessBackend()
+
+    def get(self, name: str) -> bytes | None:
+        return self._backend.get(name)
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        self._backend.set(name, bytes(value), ttl=ex)
+        return True
+
+    def delete(self, *names: str) -> int:
+        for name in names:
+            self._backend.delete(name)
+        return len(names)
+
+
+def build_cache_backend(kind: str | None = None) -> CacheBackend:
+    """Backend named by `kind` (settings.CACHE_BACKEND by default): memory, disk, redis or local-redis."""
+    kind = (kind or settings.CACHE_BACKEND).lower().strip()
+    if kind == "memory":
+        return InProcessBackend()
+    if kind == "disk":
+        return ArrowDiskBackend(settings.CACHE_DIR)
+    if kind == "redis":
+        return RedisBackend.from_url(settings.CACHE_REDIS_URL)
+    if kind == "local-redis":
+        return RedisBackend(LocalRedis())
+    raise ValueError("Unsupported cache backend. Use 'memory', 'disk', 'redis' or 'local-redis'.")
+
+
+cache_backend = build_cache_backend()
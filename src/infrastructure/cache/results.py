@@ -0,0 +1,36 @@
+import hashlib
+import json
+from typing import Any, Callable
+
+from src.core.config import settings
+from src.domain.ports.cache_backend import CacheBackend
+from src.infrastructure.cache.backends import cache_backend
+
+
+def result_key(namespace: str, inputs: dict) -> str:
+    digest = hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def cached_result(
+    namespace: str,
+    inputs: dict,
+    compute: Callable[[], Any],
+    ttl: float | None = settings.LLM_CACHE_TTL,
+    use_cache: bool = True,
+    backend: CacheBackend | None = None,
+) -> Any:
+    """
+    Return the stored result for `inputs`, or `compute()` it and store it for `ttl` seconds.
+
+    With `use_cache=False` the result is always recomputed (and replaces the stored one).
+    """
+    backend = backend or cache_backend
+    key = result_key(namespace, inputs)
+    if use_cache:
+        cached = backend.get(key)
+        if cached is not None:
+            return cached
+    result = compute()
+    backend.set(key, result, ttl=ttl)
+    return result
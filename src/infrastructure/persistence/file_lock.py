@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LockHeldError(RuntimeError):
+    pass
+
+
+class FileLock:
+    """
+    Inter-process lock on a file, taken with flock (msvcrt.locking on Windows).
+
+    The OS holds the lock on the open file and drops it when the owner exits,
+    however it exits, so a crashed process never leaves a stale lock behind.
+    The file also records the owner's pid, for error messages only.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._fd: int | None = None
+
+    def _owner(self) -> int | None:
+        try:
+            return int(self.path.read_text(encoding="utf-8").strip() or 0) or None
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _lock(fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+    def acquire(self) -> None:
+        if self._fd is not None:
+            raise LockHeldError(f"{self.path} is already held by this lock")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The file is never deleted: a process holding the old file could not see a new one
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if not self._lock(fd):
+            os.close(fd)
+            owner = self._owner()
+            raise LockHeldError(f"{self.path} is held by {f'process {owner}' if owner else 'another process'}")
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, str(os.getpid()).encode("utf-8"))
+        self._fd = fd
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            os.ftruncate(fd, 0)
+            self._unlock(fd)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
@@ -0,0 +1,40 @@
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+PARQUET_ENGINE = "pyarrow"
+
+
+def save_frame(data: pd.DataFrame, path: str | Path) -> None:
+    """
+    Persist a task frame as Parquet.
+
+    Column types survive the round-trip: tz-aware timestamps keep their zone
+    and categoricals keep their categories, so readers never re-parse them.
+    The file is written next to `path` and renamed over it, so concurrent
+    readers see either the old or the new version, never a partial one.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        data.to_parquet(partial, engine=PARQUET_ENGINE, index=False)
+        os.replace(partial, path)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def load_frame(
+    path: str | Path,
+    columns: list[str] | None = None,
+    filters: list[tuple] | None = None,
+) -> pd.DataFrame:
+    """
+    Load a task frame saved with `save_frame`.
+
+    `columns` projects the read to the listed columns and `filters` (pyarrow
+    DNF, e.g. [("status", "==", "Not Done")]) is pushed down to the row groups.
+    """
+    return pd.read_parquet(path, engine=PARQUET_ENGINE, columns=columns, filters=filters)
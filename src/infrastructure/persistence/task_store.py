@@ -0,0 +1,101 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+
+from src.core.config import settings
+
+TASK_COLUMNS = [
+    "list", "card", "card_id", "card_due", "card_last_activity",
+    "status", "done_date", "origin_list",
+]
+TIMESTAMP_COLUMNS = ["card_due", "card_last_activity", "done_date"]
+
+# Fixed-width UTC text, so stored timestamps sort chronologically
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+MAX_SQL_PARAMS = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    card_id TEXT PRIMARY KEY,
+    list TEXT,
+    card TEXT,
+    card_due TEXT,
+    card_last_activity TEXT,
+    status TEXT NOT NULL,
+    done_date TEXT,
+    origin_list TEXT
+);
+"""
+
+
+class TaskStore:
+    """
+    Embedded SQLite repository of Trello tasks keyed by `card_id`.
+
+    Writes are primary-key upserts, so a sync only touches the rows that
+    changed. Only absolute timestamps are kept; day-relative columns such as
+    `card_age` are derived from them on read (see views.add_relative_columns).
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path or settings.TASK_DB_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def _rows(self, data: pd.DataFrame) -> list[tuple]:
+        data = data[TASK_COLUMNS].copy()
+        for column in TIMESTAMP_COLUMNS:
+            data[column] = pd.to_datetime(data[column], utc=True).dt.strftime(TIMESTAMP_FORMAT)
+        data = data.astype(object).where(data.notna(), None)
+        return list(data.itertuples(index=False, name=None))
+
+    def _frame(self, sql: str, params: list | tuple = ()) -> pd.DataFrame:
+        with closing(self._connect()) as conn:
+            data = pd.read_sql_query(sql, conn, params=params)
+        if data.empty:
+            data = pd.DataFrame(columns=TASK_COLUMNS)
+        for column in TIMESTAMP_COLUMNS:
+            data[column] = pd.to_datetime(data[column], format=TIMESTAMP_FORMAT, utc=True)
+        return data[TASK_COLUMNS]
+
+    def upsert(self, data: pd.DataFrame) -> None:
+        columns = ", ".join(TASK_COLUMNS)
+        placeholders = ", ".join("?" for _ in TASK_COLUMNS)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in TASK_COLUMNS if column != "card_id")
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                f"INSERT INTO tasks ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT(card_id) DO UPDATE SET {updates}",
+                self._rows(data),
+            )
+
+    def delete(self, card_ids: list[str] | set[str]) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM tasks WHERE card_id = ?", [(card_id,) for card_id in card_ids])
+
+    def replace_all(self, data: pd.DataFrame) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM tasks")
+        self.upsert(data)
+
+    def count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def all(self) -> pd.DataFrame:
+        return self._frame("SELECT * FROM tasks")
+
+    def by_ids(self, card_ids: list[str] | set[str]) -> pd.DataFrame:
+        card_ids = list(card_ids)
+        chunks = [card_ids[i:i + MAX_SQL_PARAMS] for i in range(0, len(card_ids), MAX_SQL_PARAMS)]
+        frames = [
+            self._frame(f"SELECT * FROM tasks WHERE card_id IN ({', '.join('?' for _ in chunk)})", chunk)
+            for chunk in chunks
+        ]
+        return pd.concat(frames, ignore_index=True) if frames else self._frame("SELECT * FROM tasks WHERE 0")
@@ -1,9 +1,14 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import dotenv_values
 from pathlib import Path
 
+from src.core.config import settings
+
 # Try to find app.env in the project root
 ROOT_DIR = Path(__file__).parent.parent.parent.parent
 env_path = ROOT_DIR / "app.env"
@@ -12,6 +17,82 @@ env_values = dotenv_values(str(env_path) if env_path.exists() else "./app.env")
 API_KEY = env_values.get("TRELLO_API_KEY")
 API_TOKEN = env_values.get("TRELLO_API_TOKEN")
 
+TRELLO_API_URL = "https://api.trello.com/1"
+BATCH_URL_LIMIT = 10  # routes accepted by a single /1/batch call
+REQUEST_TIMEOUT = (settings.TRELLO_CONNECT_TIMEOUT, settings.TRELLO_READ_TIMEOUT)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide keep-alive session used for every Trello call.
+
+    The connection pool is sized for the fetcher's concurrent requests, so
+    parallel calls reuse warm TLS connections instead of opening new ones.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=settings.TRELLO_POOL_SIZE,
+                pool_maxsize=settings.TRELLO_POOL_SIZE,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def _batch_chunk(routes: list[str], api_url: str) -> list:
+    response = get_session().get(
+        f"{api_url}/batch",
+        params={"urls": ",".join(routes), "key": API_KEY, "token": API_TOKEN},
+        timeout=REQUEST_TIMEOUT,
+    )
+    if response.status_code >= 400:
+        raise RuntimeError(
+            f"Trello API error ({response.status_code}): {response.text[:300]}"
+        )
+    return response.json()
+
+
+def batch_get(routes: list[str], api_url: str = TRELLO_API_URL) -> list:
+    """
+    GET many Trello routes (e.g. "/cards/<id>/checklists") through /1/batch.
+
+    Routes are sent BATCH_URL_LIMIT at a time, so N routes cost ceil(N / 10)
+    requests. Results come back in the order of `routes`; a route Trello could
+    not serve yields None. Routes are joined with commas, so they cannot carry
+    comma-separated query values such as `fields=name,due`.
+
+    Raises ValueError for missing credentials/invalid routes and RuntimeError for API failures.
+    """
+    if not API_KEY or not API_TOKEN:
+        raise ValueError("Missing Trello API credentials in app.env")
+
+    if any("," in route or not route.startswith("/") for route in routes):
+        raise ValueError("Batch routes must start with '/' and cannot contain commas")
+
+    chunks = [routes[i:i + BATCH_URL_LIMIT] for i in range(0, len(routes), BATCH_URL_LIMIT)]
+    if not chunks:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(len(chunks), settings.TRELLO_POOL_SIZE)) as pool:
+        responses = list(pool.map(lambda chunk: _batch_chunk(chunk, api_url), chunks))
+
+    # Each entry is keyed by its own status code, e.g. {"200": {...}}
+    results = []
+    for chunk, chunk_response in zip(chunks, responses):
+        if len(chunk_response) != len(chunk):
+            raise RuntimeError(
+                f"Trello batch returned {len(chunk_response)} results for {len(chunk)} routes"
+            )
+        results.extend(entry.get("200") if isinstance(entry, dict) else None for entry in chunk_response)
+    return results
+
 
 def update_card_due_date(card_id: str, due_date: date) -> None:
     """
@@ -35,7 +116,7 @@ def update_card_due_date(card_id: str, due_date: date) -> None:
         "due": due_value,
     }
 
-    response = requests.put(url, params=params, timeout=30)
+    response = get_session().put(url, params=params, timeout=REQUEST_TIMEOUT)
     if response.status_code >= 400:
         raise RuntimeError(
             f"Trello API error ({response.status_code}): {response.text[:300]}"
@@ -0,0 +1,40 @@
+from pathlib import Path
+from typing import Any
+
+import streamlit.components.v1 as components
+
+# Plain HTML/CSS/JS served by Streamlit itself: no build step and no CDN, so the calendar works offline
+FRONTEND_DIR = Path(__file__).parent / "frontend"
+
+_task_calendar = components.declare_component("task_calendar", path=str(FRONTEND_DIR))
+
+
+def task_calendar(
+    changes: dict,
+    acks: dict,
+    view: str,
+    selected_date: str,
+    agenda_days: int,
+    storage_key: str,
+    key: str,
+    height: int = 980,
+) -> dict[str, Any] | None:
+    """
+    Render the task calendar. The iframe is mounted once per `key` and keeps its events between reruns.
+
+    `changes` are the event changes to apply (see CalendarSession.changes) and
+    `acks` the outcomes of its due-date edits. `view` and `selected_date` only
+    set the initial position. Returns the component's latest message: view,
+    date, event revision and unconfirmed edits.
+    """
+    return _task_calendar(
+        changes=changes,
+        acks=acks,
+        view=view,
+        selectedDate=selected_date,
+        agendaDays=agenda_days,
+        storageKey=storage_key,
+        height=height,
+        key=key,
+        default=None,
+    )
@@ -0,0 +1,390 @@
+// Task calendar: mounted once, receives event changes from Python and reports navigation and drag edits back.
+(function () {
+  const VIEWS = ['Day', 'Week', 'WorkWeek', 'Month', 'Agenda'];
+  const WEEKDAYS = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+  const MONTH_GRID_DAYS = 42;
+  const OVERDUE_COLOR = '#ef4444';
+  const PENDING_COLOR = '#2563eb';
+  const LOCAL_COLOR = '#16a34a';
+  const POLL_INTERVAL_MS = 2500;
+
+  const state = {
+    initialized: false,
+    mount: `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 8)}`,
+    view: 'Week',
+    anchor: null,
+    agendaDays: 7,
+    storageKey: null,
+    revision: 0,
+    events: new Map(), // key -> Trello event, as last received or optimistically moved
+    localEvents: [],
+    edits: [], // unconfirmed drag edits, at most one per card
+    nextEdit: 1,
+    pending: new Map(), // card id -> { editId, previous }
+    lastResult: 0, // seq of the last edit outcome handled
+    pollTimer: null,
+    dragKey: null,
+  };
+
+  // Days are 'YYYY-MM-DD' strings in UTC, like the due dates they come from
+  function toDay(date) {
+    return date.toISOString().slice(0, 10);
+  }
+
+  function parseDay(day) {
+    return new Date(`${day}T00:00:00Z`);
+  }
+
+  function addDays(day, count) {
+    const date = parseDay(day);
+    date.setUTCDate(date.getUTCDate() + count);
+    return toDay(date);
+  }
+
+  function today() {
+    return toDay(new Date());
+  }
+
+  function eventDay(event) {
+    return String(event.StartTime).slice(0, 10);
+  }
+
+  function withDay(event, day) {
+    return { ...event, StartTime: `${day}T09:00:00+00:00`, EndTime: `${day}T10:00:00+00:00` };
+  }
+
+  function eventKey(event) {
+    return event.CardId || event.Id;
+  }
+
+  // Same spans as calendar_window() in src/application/calendar/events.py
+  function visibleWindow(view, anchor) {
+    const weekStart = addDays(anchor, -parseDay(anchor).getUTCDay());
+    if (view === 'Day') return [anchor, anchor];
+    if (view === 'Week') return [weekStart, addDays(weekStart, 6)];
+    if (view === 'WorkWeek') return [addDays(weekStart, 1), addDays(weekStart, 5)];
+    if (view === 'Month') {
+      const first = `${anchor.slice(0, 8)}01`;
+      const gridStart = addDays(first, -parseDay(first).getUTCDay());
+      return [gridStart, addDays(gridStart, MONTH_GRID_DAYS - 1)];
+    }
+    return [anchor, addDays(anchor, state.agendaDays - 1)];
+  }
+
+  function daysBetween(start, end) {
+    const days = [];
+    for (let day = start; day <= end; day = addDays(day, 1)) days.push(day);
+    return days;
+  }
+
+  function showStatus(message, type = '') {
+    const status = document.getElementById('status');
+    status.textContent = message;
+    status.className = `status-bar ${type}`;
+  }
+
+  // Local-only events, stored in this browser
+  function loadLocalEvents() {
+    try {
+      const raw = window.localStorage.getItem(state.storageKey);
+      return raw ? JSON.parse(raw) : [];
+    } catch (error) {
+      console.warn('Could not read local events', error);
+      return [];
+    }
+  }
+
+  function saveLocalEvents() {
+    window.localStorage.setItem(state.storageKey, JSON.stringify(state.localEvents));
+  }
+
+  function addLocalEvent(day) {
+    const subject = window.prompt('New local event');
+    if (!subject) return;
+    state.localEvents.push(withDay({
+      Id: `local-${Date.now()}-${Math.round(Math.random() * 100000)}`,
+      Subject: subject,
+      IsAllDay: true,
+      Source: 'local',
+      CategoryColor: LOCAL_COLOR,
+    }, day));
+    saveLocalEvents();
+    render();
+  }
+
+  function removeLocalEvent(id) {
+    state.localEvents = state.localEvents.filter((event) => event.Id !== id);
+    saveLocalEvents();
+    render();
+  }
+
+  // Messages to Python: where the calendar is, which revision it holds and the edits not yet confirmed
+  function report() {
+    const [start, end] = visibleWindow(state.view, state.anchor);
+    Streamlit.setComponentValue({
+      mount: state.mount,
+      view: state.view,
+      anchor: state.anchor,
+      start,
+      end,
+      revision: state.revision,
+      edits: state.edits,
+    });
+  }
+
+  function navigate(view, anchor) {
+    state.view = view;
+    state.anchor = anchor;
+    render();
+    report();
+  }
+
+  function step(direction) {
+    if (direction === 0) return navigate(state.view, today());
+    const sizes = { Day: 1, Week: 7, WorkWeek: 7, Agenda: state.agendaDays };
+    if (state.view === 'Month') {
+      const date = parseDay(`${state.anchor.slice(0, 8)}01`);
+      date.setUTCMonth(date.getUTCMonth() + direction);
+      return navigate(state.view, toDay(date));
+    }
+    return navigate(state.view, addDays(state.anchor, direction * sizes[state.view]));
+  }
+
+  function moveEvent(key, day) {
+    const local = state.localEvents.find((event) => event.Id === key);
+    if (local) {
+      Object.assign(local, withDay(local, day));
+      saveLocalEvents();
+      return render();
+    }
+    const event = state.events.get(key);
+    if (!event || event.IsReadonly || eventDay(event) === day) return;
+
+    // Optimistic: show the move now, keep what to restore if Trello rejects it
+    const editId = state.nextEdit++;
+    const pending = state.pending.get(event.CardId) || { previous: { ...event } };
+    pending.editId = editId;
+    state.pending.set(event.CardId, pending);
+    const isOverdue = day < today();
+    state.events.set(key, { ...withDay(event, day), HasDueDate: true, IsOverdue: isOverdue, CategoryColor: isOverdue ? OVERDUE_COLOR : PENDING_COLOR });
+    state.edits = state.edits.filter((edit) => edit.cardId !== event.CardId);
+    state.edits.push({ id: editId, cardId: event.CardId, due: day });
+    showStatus(`Moving “${event.Subject}” to ${day}…`);
+    render();
+    report();
+  }
+
+  function applyAcks(acks) {
+    if (!acks || acks.mount !== state.mount) return;
+    let changed = false;
+    for (const result of acks.results || []) {
+      if (result.seq <= state.lastResult) continue;
+      state.lastResult = result.seq;
+      const before = state.edits.length;
+      state.edits = state.edits.filter((edit) => edit.id > result.id || edit.cardId !== result.cardId);
+      changed = changed || state.edits.length !== before;
+
+      const pending = state.pending.get(result.cardId);
+      if (!pending || pending.editId !== result.id) {
+        if (pending && result.ok) {
+          // A newer drag of the same card is in flight; a failure of that one restores this confirmed day
+          pending.previous = withDay(pending.previous, result.due);
+        } else if (!result.ok) {
+          // A queued write failed after its edit was confirmed: Python sends the card back with its next changes
+          showStatus(result.message || 'Trello update failed.', 'error');
+        }
+        continue;
+      }
+      state.pending.delete(result.cardId);
+      changed = true;
+      const event = state.events.get(result.cardId);
+      if (result.ok) {
+        showStatus(`Moved “${event ? event.Subject : result.cardId}” to ${result.due}; Trello is updated in the background. Refresh data to update local reports.`, 'success');
+      } else {
+        state.events.set(result.cardId, pending.previous);
+        showStatus(result.message || 'Trello update failed.', 'error');
+      }
+    }
+    if (changed) render();
+
+    // Check back while writes are queued on the server, so a late failure is shown and undone
+    window.clearTimeout(state.pollTimer);
+    if (acks.queued) state.pollTimer = window.setTimeout(report, POLL_INTERVAL_MS);
+  }
+
+  function applyChanges(changes) {
+    if (!changes || changes.revision === state.revision) return false;
+    if (changes.base !== null && changes.base !== state.revision) {
+      // Changes for another revision: tell Python which one this calendar holds
+      report();
+      return false;
+    }
+    if (changes.base === null) state.events.clear();
+    for (const key of changes.remove || []) state.events.delete(key);
+    for (const event of changes.upsert || []) {
+      // Cards with a drag in flight keep their optimistic day until it is confirmed
+      if (!state.pending.has(event.CardId)) state.events.set(eventKey(event), event);
+    }
+    state.revision = changes.revision;
+    return true;
+  }
+
+  function chip(event) {
+    const element = document.createElement('div');
+    const isLocal = event.Source === 'local';
+    const movable = isLocal || !event.IsReadonly;
+    element.className = `event-chip ${isLocal ? 'local-event' : 'trello-task'}`;
+    if (event.IsOverdue) element.classList.add('overdue-task');
+    if (!movable) element.classList.add('readonly');
+    if (!isLocal && state.pending.has(event.CardId)) element.classList.add('pending');
+    element.style.backgroundColor = event.CategoryColor || (isLocal ? LOCAL_COLOR : PENDING_COLOR);
+    element.title = event.Description || event.Subject;
+    element.draggable = movable;
+    element.addEventListener('dragstart', (dragEvent) => {
+      state.dragKey = isLocal ? event.Id : eventKey(event);
+      dragEvent.dataTransfer.effectAllowed = 'move';
+    });
+
+    const label = document.createElement('span');
+    label.textContent = event.Subject;
+    element.appendChild(label);
+    if (isLocal) {
+      const remove = document.createElement('button');
+      remove.className = 'remove';
+      remove.type = 'button';
+      remove.textContent = '×';
+      remove.title = 'Delete local event';
+      remove.addEventListener('click', () => removeLocalEvent(event.Id));
+      element.appendChild(remove);
+    }
+    return element;
+  }
+
+  function dayCell(day, events, className) {
+    const cell = document.createElement('div');
+    cell.className = className;
+    if (day === today()) cell.classList.add('today');
+    cell.addEventListener('dragover', (dragEvent) => {
+      dragEvent.preventDefault();
+      cell.classList.add('drop-target');
+    });
+    cell.addEventListener('dragleave', () => cell.classList.remove('drop-target'));
+    cell.addEventListener('drop', (dragEvent) => {
+      dragEvent.preventDefault();
+      cell.classList.remove('drop-target');
+      if (state.dragKey) moveEvent(state.dragKey, day);
+      state.dragKey = null;
+    });
+    cell.addEventListener('dblclick', (clickEvent) => {
+      if (clickEvent.target === cell || clickEvent.target.classList.contains('day-number')) addLocalEvent(day);
+    });
+    (events.get(day) || []).forEach((event) => cell.appendChild(chip(event)));
+    return cell;
+  }
+
+  function label(day, options) {
+    return parseDay(day).toLocaleDateString(undefined, { timeZone: 'UTC', ...options });
+  }
+
+  function render() {
+    const [start, end] = visibleWindow(state.view, state.anchor);
+    const byDay = new Map();
+    for (const event of [...state.events.values(), ...state.localEvents]) {
+      const day = eventDay(event);
+      if (day < start || day > end) continue;
+      if (!byDay.has(day)) byDay.set(day, []);
+      byDay.get(day).push(event);
+    }
+
+    const calendar = document.getElementById('calendar');
+    calendar.replaceChildren();
+    const days = daysBetween(start, end);
+
+    if (state.view === 'Agenda') {
+      const list = document.createElement('div');
+      list.className = 'grid';
+      days.forEach((day) => {
+        const row = document.createElement('div');
+        row.className = 'agenda-row';
+        const heading = document.createElement('div');
+        heading.className = 'day-number';
+        heading.textContent = label(day, { weekday: 'short', day: 'numeric', month: 'short' });
+        row.appendChild(heading);
+        row.appendChild(dayCell(day, byDay, 'agenda-events'));
+        list.appendChild(row);
+      });
+      calendar.appendChild(list);
+    } else {
+      const grid = document.createElement('div');
+      const isMonth = state.view === 'Month';
+      grid.className = `grid ${isMonth ? 'month' : 'columns'}`;
+      if (!isMonth) grid.style.gridTemplateColumns = `repeat(${days.length}, minmax(0, 1fr))`;
+      (isMonth ? WEEKDAYS : days.map((day) => label(day, { weekday: 'short', day: 'numeric', month: 'short' })))
+        .forEach((text) => {
+          const header = document.createElement('div');
+          header.className = 'weekday-header';
+          header.textContent = text;
+          grid.appendChild(header);
+        });
+      const month = state.anchor.slice(0, 7);
+      days.forEach((day) => {
+        const cell = dayCell(day, byDay, `day-cell${isMonth && day.slice(0, 7) !== month ? ' outside' : ''}`);
+        const number = document.createElement('div');
+        number.className = 'day-number';
+        number.textContent = isMonth ? String(Number(day.slice(8))) : '';
+        cell.prepend(number);
+        grid.appendChild(cell);
+      });
+      calendar.appendChild(grid);
+    }
+
+    document.getElementById('range').textContent = state.view === 'Month'
+      ? label(state.anchor, { month: 'long', year: 'numeric' })
+      : `${label(start, { day: 'numeric', month: 'short' })} – ${label(end, { day: 'numeric', month: 'short', year: 'numeric' })}`;
+    document.querySelectorAll('#views button').forEach((button) => {
+      button.classList.toggle('active', button.dataset.view === state.view);
+    });
+    Streamlit.setFrameHeight();
+  }
+
+  function initialize(args) {
+    state.view = VIEWS.includes(args.view) ? args.view : 'Week';
+    state.anchor = args.selectedDate || today();
+    state.agendaDays = args.agendaDays || state.agendaDays;
+    state.storageKey = args.storageKey;
+    state.localEvents = loadLocalEvents().map((event) => ({ ...event, Source: 'local' }));
+
+    const views = document.getElementById('views');
+    VIEWS.forEach((view) => {
+      const button = document.createElement('button');
+      button.type = 'button';
+      button.dataset.view = view;
+      button.textContent = view === 'WorkWeek' ? 'Work Week' : view;
+      button.addEventListener('click', () => navigate(view, state.anchor));
+      views.appendChild(button);
+    });
+    document.querySelectorAll('[data-nav]').forEach((button) => {
+      button.addEventListener('click', () => step(Number(button.dataset.nav)));
+    });
+    state.initialized = true;
+    // Announce this mount, so Python sends the events of the visible window
+    report();
+  }
+
+  Streamlit.onRender((args) => {
+    if (!state.initialized) initialize(args);
+    applyAcks(args.acks);
+    if (applyChanges(args.changes)) {
+      render();
+      report();
+      const trello = [...state.events.values()];
+      const overdue = trello.filter((event) => event.IsOverdue).length;
+      if (!state.pending.size) {
+        showStatus(`${trello.length} pending Trello tasks in this view (${overdue} overdue). Local events are saved in this browser only.`);
+      }
+    } else if (!document.getElementById('calendar').hasChildNodes()) {
+      render();
+    }
+  });
+  Streamlit.setComponentReady();
+})();
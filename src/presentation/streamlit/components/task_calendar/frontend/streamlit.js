@@ -0,0 +1,28 @@
+// Minimal client of Streamlit's custom component protocol (the postMessage API behind streamlit-component-lib)
+(function () {
+  const listeners = [];
+
+  function send(type, data) {
+    window.parent.postMessage({ isStreamlitMessage: true, type, ...data }, '*');
+  }
+
+  window.addEventListener('message', (event) => {
+    if (!event.data || event.data.type !== 'streamlit:render') return;
+    listeners.forEach((listener) => listener(event.data.args || {}));
+  });
+
+  window.Streamlit = {
+    onRender(listener) {
+      listeners.push(listener);
+    },
+    setComponentReady() {
+      send('streamlit:componentReady', { apiVersion: 1 });
+    },
+    setFrameHeight(height) {
+      send('streamlit:setFrameHeight', { height: height === undefined ? document.body.scrollHeight : height });
+    },
+    setComponentValue(value) {
+      send('streamlit:setComponentValue', { value, dataType: 'json' });
+    },
+  };
+})();
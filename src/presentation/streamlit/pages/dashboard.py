@@ -1,3 +1,5 @@
+from datetime import date
+
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -5,58 +7,33 @@ import streamlit as st
 from plotly_calplot import calplot
 
 from src.core.config import settings
-from src.core.dashboard_theme import DASHBOARD_COLORS
+from src.core.dashboard_theme import DASHBOARD_COLORS, DASHBOARD_THEME_KEY
+from src.application.analytics.dashboard import (
+    DashboardAnalytics,
+    DashboardFilters,
+    FilterOptions,
+    data_version,
+    load_dashboard_analytics,
+    load_filter_options,
+)
+from src.application.data_pipeline.dataset_cache import dataset_cache
+from src.application.data_pipeline.views import utc_today
 from src.infrastructure.trello.trello_client import update_card_due_date
 
+MONTH_LABELS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
 # Removed st.set_page_config from here as it should be in the main app.py when using st.navigation
 # Or if this page is intended to be used standalone, it can stay, but it might cause warnings.
 # Keeping it for now but updating imports.
 
-@st.cache_data
-def load_data():
-    all_tasks = pd.read_csv(settings.ALL_DATA_PATH)
-    done_tasks = pd.read_csv(settings.DONE_DATA_PATH)
-    pending_tasks = pd.read_csv(settings.PENDING_DATA_PATH)
-
-    all_tasks["card_due"] = pd.to_datetime(all_tasks.get("card_due"), errors="coerce", utc=True)
-    done_tasks["done_date"] = pd.to_datetime(done_tasks.get("done_date"), errors="coerce", utc=True)
-    pending_tasks["card_due"] = pd.to_datetime(pending_tasks.get("card_due"), errors="coerce", utc=True)
-
-    return all_tasks, done_tasks, pending_tasks
-
-
-def compute_metrics(tasks_df: pd.DataFrame) -> tuple[int, int, int, float]:
-    total = len(tasks_df)
-    completed = len(tasks_df[tasks_df["status"] == "Done"])
-    pending = total - completed
-    completion_rate = (completed / total * 100) if total else 0.0
-    return total, completed, pending, completion_rate
-
-
-def filter_data(
-    all_tasks: pd.DataFrame,
-    done_tasks: pd.DataFrame,
-    pending_tasks: pd.DataFrame,
-) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, tuple[pd.Timestamp, pd.Timestamp]]:
+def read_filters(options: FilterOptions) -> DashboardFilters:
     st.sidebar.header("Filters")
 
-    status_options = sorted(all_tasks["status"].dropna().unique().tolist())
-    selected_status = st.sidebar.multiselect("Status", status_options, default=status_options)
-
-    list_pool = sorted(
-        set(all_tasks.get("list", pd.Series(dtype=str)).dropna().tolist())
-        | set(done_tasks.get("origin_list", pd.Series(dtype=str)).dropna().tolist())
-        | set(pending_tasks.get("list", pd.Series(dtype=str)).dropna().tolist())
-    )
-    selected_lists = st.sidebar.multiselect("Lists", list_pool, default=list_pool)
-
+    selected_status = st.sidebar.multiselect("Status", options.statuses, default=options.statuses)
+    selected_lists = st.sidebar.multiselect("Lists", options.lists, default=options.lists)
     task_query = st.sidebar.text_input("Task contains", "").strip().lower()
 
-    today_utc = pd.Timestamp.now(tz="UTC").normalize()
-    done_dates = done_tasks["done_date"].dropna()
-    min_done = done_dates.min().date() if not done_dates.empty else today_utc.date()
-    max_done = done_dates.max().date() if not done_dates.empty else today_utc.date()
-
+    min_done, max_done = options.done_range
     done_range = st.sidebar.date_input(
         "Done date range",
         value=(min_done, max_done),
@@ -68,10 +45,7 @@ def filter_data(
     else:
         done_start, done_end = done_range
 
-    due_dates = pending_tasks["card_due"].dropna()
-    min_due = due_dates.min().date() if not due_dates.empty else today_utc.date()
-    max_due = due_dates.max().date() if not due_dates.empty else today_utc.date()
-
+    min_due, max_due = options.due_range
     due_range = st.sidebar.date_input(
         "Pending due date range",
         value=(min_due, max_due),
@@ -83,37 +57,15 @@ def filter_data(
     else:
         due_start, due_end = due_range
 
-    filtered_all = all_tasks.copy()
-    if selected_status:
-        filtered_all = filtered_all[filtered_all["status"].isin(selected_status)]
-    if selected_lists:
-        filtered_all = filtered_all[filtered_all["list"].isin(selected_lists)]
-    if task_query:
-        filtered_all = filtered_all[filtered_all["card"].fillna("").str.lower().str.contains(task_query)]
-
-    filtered_done = done_tasks.copy()
-    if selected_lists:
-        filtered_done = filtered_done[filtered_done["origin_list"].isin(selected_lists)]
-    if task_query:
-        filtered_done = filtered_done[filtered_done["card"].fillna("").str.lower().str.contains(task_query)]
-    done_start_ts = pd.Timestamp(done_start, tz="UTC")
-    done_end_ts = pd.Timestamp(done_end, tz="UTC") + pd.Timedelta(days=1)
-    filtered_done = filtered_done[
-        (filtered_done["done_date"] >= done_start_ts) & (filtered_done["done_date"] < done_end_ts)
-    ]
-
-    filtered_pending = pending_tasks.copy()
-    if selected_lists:
-        filtered_pending = filtered_pending[filtered_pending["list"].isin(selected_lists)]
-    if task_query:
-        filtered_pending = filtered_pending[filtered_pending["card"].fillna("").str.lower().str.contains(task_query)]
-    due_start_ts = pd.Timestamp(due_start, tz="UTC")
-    due_end_ts = pd.Timestamp(due_end, tz="UTC") + pd.Timedelta(days=1)
-    filtered_pending = filtered_pending[
-        (filtered_pending["card_due"] >= due_start_ts) & (filtered_pending["card_due"] < due_end_ts)
-    ]
-
-    return filtered_all, filtered_done, filtered_pending, (done_start_ts, done_end_ts - pd.Timedelta(days=1))
+    return DashboardFilters(
+        statuses=tuple(selected_status),
+        lists=tuple(selected_lists),
+        task_query=task_query,
+        done_start=done_start,
+        done_end=done_end,
+        due_start=due_start,
+        due_end=due_end,
+    )
 
 
 def render_due_date_updater(tasks_df: pd.DataFrame) -> None:
@@ -139,75 +91,39 @@ def render_due_date_updater(tasks_df: pd.DataFrame) -> None:
             try:
                 update_card_due_date(selected_card_id, selected_due)
                 st.success(
-                    "Due date updated in Trello. Run data refresh to sync local CSV files."
+                    "Due date updated in Trello. Run data refresh to sync local datasets."
                 )
             except Exception as exc:
                 st.error(f"Could not update due date: {exc}")
 
 
-def remove_timezones(value: str) -> str:
-    return value.split()[0]
-
-
-all_df, done_df, pending_df = load_data()
-filtered_df, filtered_done_df, filtered_pending_df, (period_start, period_end) = filter_data(
-    all_df, done_df, pending_df
-)
-
-total_tasks, completed_tasks, pending_tasks, _ = compute_metrics(filtered_df)
-
-st.title("📊 Task Analytics Dashboard")
-st.caption(f"**Filtered Period:** {period_start.date()} to {period_end.date()}")
-render_due_date_updater(filtered_df)
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    done_with_weekday = filtered_done_df.copy()
-    done_with_weekday["weekday"] = done_with_weekday["done_date"].dt.day_name()
-    most_productive = done_with_weekday["weekday"].value_counts().idxmax() if not done_with_weekday.empty else "N/A"
-    st.metric("Best Day", most_productive, border=True)
+def pending_per_list_figure(analytics: DashboardAnalytics) -> go.Figure:
+    fig = px.bar(analytics.pending_per_list, x="list", y="count", title="Not Done Tasks per List", height=350)
+    fig.update_layout(title_x=0.4, margin=dict(l=20, r=20, t=50, b=40))
+    return fig
 
-with col2:
-    left, center, right = st.columns(3)
-    with left:
-        st.metric("Total", total_tasks, border=True)
-    with center:
-        st.metric("Completed", completed_tasks, border=True)
-    with right:
-        st.metric("Pending", pending_tasks, border=True)
 
-with col3:
-    days_in_period = max((period_end.date() - period_start.date()).days + 1, 1)
-    avg_daily = len(filtered_done_df) / days_in_period
-    st.metric("Avg Tasks/Day", f"{avg_daily:.2f}", border=True)
+def resolution_note(resolution: str, summary: str = "") -> str:
+    """Title suffix naming the bucket size of a downsampled chart, e.g. " (weekly min/max)"."""
+    if resolution == "day":
+        return ""
+    return f" ({resolution}ly{' ' + summary if summary else ''})"
 
-st.divider()
-left, right = st.columns([2, 2])
 
-with left:
-    task_counts = (
-        filtered_df[filtered_df["status"] == "Not Done"].groupby("list").size().reset_index(name="count")
+def daily_progress_figure(analytics: DashboardAnalytics) -> go.Figure:
+    fig = px.line(
+        analytics.done_progress,
+        x="Date",
+        y="Tasks Completed",
+        title=f"Daily Progress{resolution_note(analytics.done_resolution, 'min/max')}",
     )
-    fig = px.bar(task_counts, x="list", y="count", title="Not Done Tasks per List", height=350)
-    fig.update_layout(title_x=0.4, margin=dict(l=20, r=20, t=50, b=40))
-    st.plotly_chart(fig, use_container_width=True)
-
-with right:
-    daily_tasks = filtered_done_df.groupby(filtered_done_df["done_date"].dt.date).size()
-    all_days = pd.date_range(start=period_start.date(), end=period_end.date(), freq="D").date
-    daily_tasks = daily_tasks.reindex(all_days, fill_value=0)
-    daily_df_chart = pd.DataFrame({"Date": daily_tasks.index, "Tasks Completed": daily_tasks.values})
-    fig = px.line(daily_df_chart, x="Date", y="Tasks Completed", title="Daily Progress")
     fig.update_layout(title_x=0.45, margin=dict(l=20, r=20, t=50, b=40), height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-st.divider()
-left, right = st.columns([2, 2])
 
-with right:
+def pending_share_figure(analytics: DashboardAnalytics) -> go.Figure:
     fig = px.pie(
-        task_counts,
+        analytics.pending_per_list,
         names="list",
         values="count",
         title="Not Done Percentage",
@@ -216,14 +132,12 @@ with right:
     )
     fig.update_layout(title_x=0.3)
     fig.update_traces(textposition="inside", textinfo="percent")
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-with left:
-    done_task_counts = filtered_done_df["origin_list"].value_counts().reset_index()
-    done_task_counts.columns = ["origin_list", "count"]
-    done_task_counts = done_task_counts[done_task_counts["origin_list"] != "other"]
+
+def done_by_origin_figure(analytics: DashboardAnalytics) -> go.Figure:
     fig = px.pie(
-        done_task_counts,
+        analytics.done_by_origin,
         names="origin_list",
         values="count",
         title="Done Tasks by List",
@@ -232,22 +146,12 @@ with left:
     )
     fig.update_layout(title_x=0.3)
     fig.update_traces(textposition="inside", textinfo="percent")
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-st.divider()
-left, right = st.columns([2, 2])
-
-with left:
-    day_order = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-    weekly_df = filtered_done_df.copy()
-    weekly_df["weekday"] = pd.Categorical(
-        weekly_df["done_date"].dt.day_name(), categories=day_order, ordered=True
-    )
-    weekly_df = weekly_df["weekday"].value_counts().sort_index().reset_index()
-    weekly_df.columns = ["Day", "Tasks Completed"]
 
+def weekday_figure(analytics: DashboardAnalytics) -> go.Figure:
     fig = px.bar(
-        weekly_df,
+        analytics.weekday_done,
         x="Day",
         y="Tasks Completed",
         color="Tasks Completed",
@@ -257,80 +161,58 @@ with left:
     )
     fig.update_traces(textposition="outside")
     fig.update_layout(showlegend=False, height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-with right:
-    daily_tasks = filtered_done_df.groupby(filtered_done_df["done_date"].dt.date).size()
-    all_days = pd.date_range(start=period_start.date(), end=period_end.date(), freq="D").date
-    daily_tasks = daily_tasks.reindex(all_days, fill_value=0)
-    cumulative_df = pd.DataFrame({"Date": daily_tasks.index, "Cumulative Tasks": daily_tasks.values.cumsum()})
 
-    fig = px.area(cumulative_df, x="Date", y="Cumulative Tasks", line_shape="linear")
+def cumulative_figure(analytics: DashboardAnalytics) -> go.Figure:
+    fig = px.area(analytics.done_progress, x="Date", y="Cumulative Tasks", line_shape="linear")
     fig.update_layout(height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-incomplete_tasks = filtered_df[filtered_df["status"] == "Not Done"].copy()
-old_task_age = settings.OLD_TASK_AGE
-incomplete_tasks["age_category"] = incomplete_tasks["card_age"].apply(
-    lambda x: f"Old (>{old_task_age} days)" if x > old_task_age else f"New (≤{old_task_age} days)"
-)
 
-st.subheader("Tasks Done Today")
-now_utc = pd.Timestamp.now(tz="UTC")
-start_today = now_utc.normalize()
-end_today = start_today + pd.Timedelta(days=1)
-done_today = filtered_done_df[
-    (filtered_done_df["done_date"] >= start_today) & (filtered_done_df["done_date"] < end_today)
-]
-if not done_today.empty:
-    st.success(f"You completed {len(done_today)} task(s) today")
-    st.dataframe(
-        done_today[["card", "origin_list"]].rename(columns={"card": "Task Name", "origin_list": "From List"}),
-        use_container_width=True,
+def weekday_origin_figure(analytics: DashboardAnalytics) -> go.Figure:
+    fig = px.bar(
+        analytics.weekday_origin_done,
+        x="weekday",
+        y="Tasks Completed",
+        color="origin_list",
+        title="Tasks Completed per Day (Grouped by List)",
+        text="Tasks Completed",
     )
-else:
-    st.info("No tasks completed yet today")
-
-st.subheader("Oldest Pending Task")
-oldest_tasks = incomplete_tasks.sort_values(by="card_age", ascending=False)[["card", "card_age", "list"]].head(5)
-st.dataframe(oldest_tasks, use_container_width=True)
-
-stack_day_order = ["Friday", "Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday"]
-stacked_weekly_df = filtered_done_df.copy()
-stacked_weekly_df["weekday"] = pd.Categorical(
-    stacked_weekly_df["done_date"].dt.day_name(), categories=stack_day_order, ordered=True
-)
-stacked_weekly_df = (
-    stacked_weekly_df[stacked_weekly_df["origin_list"] != "other"]
-    .groupby(["weekday", "origin_list"])
-    .size()
-    .reset_index(name="Tasks Completed")
-    .sort_values("weekday")
-)
+    fig.update_layout(barmode="group", height=600)
+    fig.update_traces(textposition="inside")
+    return fig
+
+
+def month_heatmap_figure(counts: pd.DataFrame, column: str, title: str, colorscale: str) -> go.Figure:
+    """Year x month grid, used instead of calplot when a calendar spans too many days."""
+    months = pd.to_datetime(counts[column])
+    grid = (
+        pd.DataFrame({"Year": months.dt.year, "Month": months.dt.strftime("%b"), "count": counts["count"]})
+        .pivot(index="Year", columns="Month", values="count")
+        .reindex(columns=MONTH_LABELS)
+    )
+    fig = px.imshow(
+        grid,
+        color_continuous_scale=colorscale,
+        text_auto=True,
+        aspect="auto",
+        labels={"color": "Tasks"},
+        title=title,
+        template=DASHBOARD_COLORS["dark"]["template"],
+    )
+    fig.update_yaxes(type="category")
+    fig.update_layout(title_x=0.5)
+    return fig
 
-fig = px.bar(
-    stacked_weekly_df,
-    x="weekday",
-    y="Tasks Completed",
-    color="origin_list",
-    title="Tasks Completed per Day (Grouped by List)",
-    text="Tasks Completed",
-)
-fig.update_layout(barmode="group", height=600)
-fig.update_traces(textposition="inside")
-st.plotly_chart(fig, use_container_width=True)
 
-# done tasks heatmap
-st.divider()
-done_df_calplot = filtered_done_df.dropna(subset=["done_date"]).copy()
-done_df_calplot["done_date"] = done_df_calplot["done_date"].astype(str).apply(remove_timezones)
-done_counts_df = done_df_calplot["done_date"].value_counts().reset_index()
-done_counts_df.columns = ["done_date", "count"]
-if done_counts_df.empty:
-    st.info("No completed-task data is available for the selected filters.")
-else:
+def done_heatmap_figure(analytics: DashboardAnalytics) -> go.Figure:
+    if analytics.done_calendar_resolution == "month":
+        return month_heatmap_figure(
+            analytics.done_calendar, "done_date", "Done Tasks per Month", DASHBOARD_COLORS["continuous_scale"]
+        )
     fig = calplot(
-        done_counts_df,
+        analytics.done_calendar,
         x="done_date",
         y="count",
         name="Done Tasks",
@@ -341,18 +223,16 @@ else:
     fig.update_layout(
         title={"text": "Done Tasks Heatmap", "y": 0.99, "x": 0.5, "xanchor": "center", "yanchor": "top"}
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-# pending due dates heatmap
-pending_df_calplot = filtered_pending_df.dropna(subset=["card_due"]).copy()
-pending_df_calplot["card_due"] = pending_df_calplot["card_due"].astype(str).apply(remove_timezones)
-counts_df = pending_df_calplot["card_due"].value_counts().reset_index()
-counts_df.columns = ["card_due", "count"]
-if counts_df.empty:
-    st.info("No pending due-date data is available for the selected filters.")
-else:
+
+def due_heatmap_figure(analytics: DashboardAnalytics) -> go.Figure:
+    if analytics.due_calendar_resolution == "month":
+        return month_heatmap_figure(
+            analytics.due_calendar, "card_due", "Pending Tasks Due per Month", DASHBOARD_COLORS["heatmap_scale"]
+        )
     fig = calplot(
-        counts_df,
+        analytics.due_calendar,
         x="card_due",
         y="count",
         dark_theme=True,
@@ -363,104 +243,196 @@ else:
     fig.update_layout(
         title={"text": "Pending Tasks Due Dates", "y": 0.99, "x": 0.5, "xanchor": "center", "yanchor": "top"}
     )
-    st.plotly_chart(fig, use_container_width=False)
+    return fig
 
-st.subheader("Overdue Tasks")
-today = pd.Timestamp.now(tz="UTC").normalize()
-overdue_tasks = filtered_pending_df[filtered_pending_df["card_due"] < today]
-st.dataframe(
-    overdue_tasks[["card", "list", "card_due"]].rename(
-        columns={"card": "Task Name", "list": "List", "card_due": "Due Date"}
-    ),
-    use_container_width=True,
-)
-
-st.subheader("Tasks Due Today")
-today_start = pd.Timestamp.now(tz="UTC").normalize()
-today_end = today_start + pd.Timedelta(days=1)
-pending_due_today = filtered_pending_df[
-    (filtered_pending_df["card_due"] >= today_start) & (filtered_pending_df["card_due"] < today_end)
-]
-if not pending_due_today.empty:
-    st.dataframe(
-        pending_due_today[["card", "list", "card_due"]].rename(
-            columns={"card": "Task Name", "list": "List", "card_due": "Due Date"}
-        ),
-        use_container_width=True,
-    )
-else:
-    st.info("No tasks are due today.")
-
-due_df = filtered_pending_df.copy()
-due_source_col = "list" if "list" in due_df.columns else None
-
-due_df["card_due"] = due_df["card_due"].dt.tz_convert(None).dt.normalize()
-due_df = due_df.dropna(subset=["card_due"])
-
-start = pd.Timestamp.today().normalize()
-end = start + pd.DateOffset(months=2)
-full_range_df = pd.DataFrame({"card_due": pd.date_range(start=start, end=end, freq="D")})
-
-if due_source_col:
-    due_df[due_source_col] = due_df[due_source_col].fillna("Unknown")
-    counts = due_df.groupby(["card_due", due_source_col]).size().reset_index(name="count")
-    counts = full_range_df.merge(counts, on="card_due", how="left")
-    counts[due_source_col] = counts[due_source_col].fillna("No Due Cards")
-    counts["count"] = counts["count"].fillna(0).astype(int)
 
+def due_workload_figure(analytics: DashboardAnalytics) -> go.Figure:
+    counts = analytics.due_workload
+    resolution = analytics.due_workload_resolution
     color_palette = DASHBOARD_COLORS["qualitative_fallback"]
-    source_values = counts[due_source_col].dropna().unique()
+    source_values = counts["list"].dropna().unique()
     color_map = {source: color_palette[idx % len(color_palette)] for idx, source in enumerate(sorted(source_values))}
 
     fig = px.bar(
         counts,
         x="count",
         y="card_due",
-        color=due_source_col,
+        color="list",
         orientation="h",
         barmode="stack",
         color_discrete_map=color_map,
-        labels={"count": "Due Cards", "card_due": "Due Date", due_source_col: "List"},
-        title="Pending Due Dates by List",
+        labels={"count": "Due Cards", "card_due": "Due Date", "list": "List"},
+        title=f"Pending Due Dates by List{resolution_note(resolution, 'totals')}",
     )
-else:
-    counts = due_df.groupby("card_due").size().reset_index()
-    counts.columns = ["card_due", "count"]
-    counts = full_range_df.merge(counts, on="card_due", how="left").fillna(0)
-    counts["count"] = counts["count"].astype(int)
-    fig = go.Figure([go.Bar(x=counts["count"], y=counts["card_due"], orientation="h", name="Due Cards")])
-
-fig.update_layout(
-    template=DASHBOARD_COLORS["dark"]["template"],
-    paper_bgcolor=DASHBOARD_COLORS["dark"]["paper_bg"],
-    plot_bgcolor=DASHBOARD_COLORS["dark"]["plot_bg"],
-    font=dict(color=DASHBOARD_COLORS["dark"]["font"]),
-    height=max(len(counts) * 20, 420),
-    legend_title_text="List",
-)
-fig.update_xaxes(showticklabels=False, showgrid=False)
-fig.update_yaxes(
-    tickmode="array",
-    tickvals=counts["card_due"],
-    ticktext=counts["card_due"].dt.strftime("%d %b"),
-    showgrid=True,
-    gridcolor=DASHBOARD_COLORS["dark"]["grid"],
-)
-fig.update_yaxes(autorange="reversed")
 
-annotations = []
-max_val = max(counts.groupby("card_due")["count"].sum().max(), 1)
-for _, row in counts.groupby("card_due")["count"].sum().reset_index().iterrows():
-    annotations.append(
+    fig.update_layout(
+        template=DASHBOARD_COLORS["dark"]["template"],
+        paper_bgcolor=DASHBOARD_COLORS["dark"]["paper_bg"],
+        plot_bgcolor=DASHBOARD_COLORS["dark"]["plot_bg"],
+        font=dict(color=DASHBOARD_COLORS["dark"]["font"]),
+        height=max(len(counts) * 20, 420),
+        legend_title_text="List",
+    )
+    fig.update_xaxes(showticklabels=False, showgrid=False)
+    fig.update_yaxes(
+        tickmode="array",
+        tickvals=counts["card_due"],
+        ticktext=counts["card_due"].dt.strftime("%b %Y" if resolution == "month" else "%d %b"),
+        showgrid=True,
+        gridcolor=DASHBOARD_COLORS["dark"]["grid"],
+    )
+    fig.update_yaxes(autorange="reversed")
+
+    totals = analytics.due_totals
+    label_x = max(totals["count"].max(), 1) * 1.2
+    annotations = [
         {
-            "x": max_val * 1.2,
-            "y": row["card_due"],
-            "text": str(int(row["count"])),
+            "x": label_x,
+            "y": due_day,
+            "text": str(count),
             "showarrow": False,
             "xanchor": "left",
             "font": {"color": DASHBOARD_COLORS["dark"]["font"]},
         }
+        for due_day, count in zip(totals["card_due"], totals["count"].tolist())
+    ]
+
+    fig.update_layout(annotations=annotations)
+    return fig
+
+
+FIGURE_BUILDERS = {
+    "pending_per_list": pending_per_list_figure,
+    "daily_progress": daily_progress_figure,
+    "pending_share": pending_share_figure,
+    "done_by_origin": done_by_origin_figure,
+    "weekday": weekday_figure,
+    "cumulative": cumulative_figure,
+    "weekday_origin": weekday_origin_figure,
+    "done_heatmap": done_heatmap_figure,
+    "due_heatmap": due_heatmap_figure,
+    "due_workload": due_workload_figure,
+}
+
+
+# Built figures are shared by every session per (data version, chart, day, filters, theme); a hit
+# skips the Plotly Express / calplot construction entirely. Figures must not be mutated after this.
+@dataset_cache.dataset(
+    "dashboard_figures",
+    version=data_version,
+    depends_on=("tasks",),
+    max_entries=settings.DASHBOARD_FIGURE_ENTRIES,
+    shared=False,
+)
+def build_figure(chart_id: str, day: date, filters: DashboardFilters, theme: str) -> go.Figure:
+    return FIGURE_BUILDERS[chart_id](load_dashboard_analytics(day, filters))
+
+
+def show_figure(chart_id: str, use_container_width: bool = True) -> None:
+    fig = build_figure(chart_id, today_utc, filters, DASHBOARD_THEME_KEY)
+    st.plotly_chart(fig, use_container_width=use_container_width)
+
+
+# All aggregates come from the analytics module, memoized per (data version, day, filters)
+today_utc = utc_today()
+filters = read_filters(load_filter_options(today_utc))
+analytics = load_dashboard_analytics(today_utc, filters)
+metrics = analytics.metrics
+
+st.title("📊 Task Analytics Dashboard")
+st.caption(f"**Filtered Period:** {filters.done_start} to {filters.done_end}")
+render_due_date_updater(analytics.pending_cards)
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric("Best Day", metrics.best_day, border=True)
+
+with col2:
+    left, center, right = st.columns(3)
+    with left:
+        st.metric("Total", metrics.total, border=True)
+    with center:
+        st.metric("Completed", metrics.completed, border=True)
+    with right:
+        st.metric("Pending", metrics.pending, border=True)
+
+with col3:
+    st.metric("Avg Tasks/Day", f"{metrics.avg_daily:.2f}", border=True)
+
+st.divider()
+left, right = st.columns([2, 2])
+
+with left:
+    show_figure("pending_per_list")
+
+with right:
+    show_figure("daily_progress")
+
+st.divider()
+left, right = st.columns([2, 2])
+
+with right:
+    show_figure("pending_share")
+
+with left:
+    show_figure("done_by_origin")
+
+st.divider()
+left, right = st.columns([2, 2])
+
+with left:
+    show_figure("weekday")
+
+with right:
+    show_figure("cumulative")
+
+st.subheader("Tasks Done Today")
+done_today = analytics.done_today
+if not done_today.empty:
+    st.success(f"You completed {len(done_today)} task(s) today")
+    st.dataframe(
+        done_today[["card", "origin_list"]].rename(columns={"card": "Task Name", "origin_list": "From List"}),
+        use_container_width=True,
     )
+else:
+    st.info("No tasks completed yet today")
+
+st.subheader("Oldest Pending Task")
+st.dataframe(analytics.oldest_pending[["card", "card_age", "list"]], use_container_width=True)
+
+show_figure("weekday_origin")
+
+# done tasks heatmap
+st.divider()
+if analytics.done_calendar.empty:
+    st.info("No completed-task data is available for the selected filters.")
+else:
+    show_figure("done_heatmap")
+
+# pending due dates heatmap
+if analytics.due_calendar.empty:
+    st.info("No pending due-date data is available for the selected filters.")
+else:
+    show_figure("due_heatmap", use_container_width=False)
+
+st.subheader("Overdue Tasks")
+st.dataframe(
+    analytics.overdue[["card", "list", "card_due"]].rename(
+        columns={"card": "Task Name", "list": "List", "card_due": "Due Date"}
+    ),
+    use_container_width=True,
+)
+
+st.subheader("Tasks Due Today")
+if not analytics.due_today.empty:
+    st.dataframe(
+        analytics.due_today[["card", "list", "card_due"]].rename(
+            columns={"card": "Task Name", "list": "List", "card_due": "Due Date"}
+        ),
+        use_container_width=True,
+    )
+else:
+    st.info("No tasks are due today.")
 
-fig.update_layout(annotations=annotations)
-st.plotly_chart(fig, use_container_width=True)
+show_figure("due_workload")
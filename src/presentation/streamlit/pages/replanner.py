@@ -3,7 +3,7 @@ from datetime import datetime
 import pandas as pd
 import streamlit as st
 
-from src.core.config import settings
+from src.application.data_pipeline.views import load_pending
 from src.application.replanning.service import generate_replan_dataset
 from src.infrastructure.trello.trello_client import update_card_due_date
 
@@ -13,18 +13,8 @@ st.caption(
     "Generate a replanning dataset first, then apply due-date changes to Trello."
 )
 
-pending_df = pd.read_csv(str(settings.PENDING_DATA_PATH)).copy()
-all_df = pd.read_csv(str(settings.ALL_DATA_PATH)).copy()
-
-pending_with_ids = (
-    all_df[all_df["status"] == "Not Done"]
-    .merge(
-        pending_df[["card", "list", "card_due", "card_age", "days_to_due", "priority_score"]],
-        on=["card", "list", "card_due", "card_age"],
-        how="left",
-    )
-    .drop_duplicates(subset=["card_id"])
-)
+# The pending view already carries card ids next to the derived priority columns
+pending_with_ids = load_pending()
 
 if pending_with_ids.empty:
     st.info("No pending tasks found to replan.")
@@ -51,6 +41,12 @@ user_instruction = st.text_area(
     height=150,
 )
 
+fresh_plan = st.checkbox(
+    "New plan",
+    value=False,
+    help="Ask the model again instead of reusing the plan generated for the same tasks and instruction",
+)
+
 generate_col, apply_col = st.columns(2)
 
 with generate_col:
@@ -72,6 +68,7 @@ if generate_clicked:
                     csv_data=csv_data,
                     user_instruction=user_instruction,
                     provider=provider,
+                    use_cache=not fresh_plan,
                 )
 
                 dataset_df = pd.DataFrame(result.get("tasks_to_update", []))
@@ -1,6 +1,6 @@
 import streamlit as st
 import pandas as pd
-from src.core.config import settings
+from src.application.data_pipeline.views import load_pending
 from src.application.task_generation.service import generate_daily_tasks
 
 # st.set_page_config(
@@ -10,7 +10,9 @@ from src.application.task_generation.service import generate_daily_tasks
 
 st.header("🤖 AI Daily Task Planner")
 
-undone_df = pd.read_csv(str(settings.PENDING_DATA_PATH)).copy()
+undone_df = load_pending(
+    columns=["list", "card", "card_due", "card_age", "days_to_due", "list_completion_rate"],
+)
 
 if undone_df.empty:
     st.success("All tasks are completed")
@@ -28,6 +30,11 @@ else:
             "Include detailed reasoning",
             value=False
         )
+        fresh_plan = st.checkbox(
+            "New plan",
+            value=False,
+            help="Ask the model again instead of reusing the plan generated for the same tasks and notes"
+        )
 
     st.write("")
     generate_button = st.button(
@@ -39,11 +46,14 @@ else:
     if generate_button:
         with st.spinner("AI is planning your day..."):
             try:
-                csv_data = undone_df[['list', 'card', 'card_due']].to_csv(index=False)
+                csv_data = undone_df[
+                    ['list', 'card', 'card_due', 'card_age', 'days_to_due', 'priority_score']
+                ].to_csv(index=False)
                 result = generate_daily_tasks(
                     csv_data=csv_data,
                     user_notes=user_notes,
-                    include_reasoning=include_reasoning
+                    include_reasoning=include_reasoning,
+                    use_cache=not fresh_plan
                 )
 
                 if include_reasoning and result.get('reasoning'):
@@ -0,0 +1,90 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+from src.application.data_pipeline.dataset_cache import DatasetCache
+from src.infrastructure.cache import backends
+from src.infrastructure.cache.backends import ArrowDiskBackend, InProcessBackend, LocalRedis, RedisBackend
+from src.infrastructure.cache.results import cached_result
+
+BACKENDS = {
+    "memory": lambda tmp_path: InProcessBackend(),
+    "disk": lambda tmp_path: ArrowDiskBackend(tmp_path),
+    "local-redis": lambda tmp_path: RedisBackend(LocalRedis()),
+}
+
+
+def sample_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "card": pd.Series(["a", "b"], dtype=pd.StringDtype("pyarrow")),
+        "count": pd.Series([1, 2], dtype="int32"),
+        "card_due": pd.to_datetime(["2026-10-18T20:59:00Z", None], utc=True),
+    })
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request, tmp_path):
+    return BACKENDS[request.param](tmp_path)
+
+
+def test_backend_round_trip(backend):
+    backend.set("frame", sample_frame())
+    backend.set("json", {"plan": ["a", "b"], "score": 1.5})
+
+    pd.testing.assert_frame_equal(backend.get("frame"), sample_frame())
+    assert backend.get("json") == {"plan": ["a", "b"], "score": 1.5}
+
+    backend.delete("frame")
+    assert backend.get("frame") is None
+    assert backend.get("missing") is None
+
+
+def test_backend_entries_expire(backend, monkeypatch):
+    backend.set("json", {"plan": []}, ttl=60)
+    backend.set("frame", sample_frame(), ttl=60)
+    now = time.time()
+    monkeypatch.setattr(backends.time, "time", lambda: now + 120)
+
+    assert backend.get("json") is None
+    assert backend.get("frame") is None
+
+
+@pytest.mark.parametrize("kind", ["disk", "local-redis"])
+def test_shared_backend_serves_one_entry_to_two_caches_and_follows_versions(kind, tmp_path):
+    shared = BACKENDS[kind](tmp_path)
+    first, second = DatasetCache(backend=shared), DatasetCache(backend=shared)
+    state = {"version": 1, "loads": 0}
+
+    def load(day: str) -> pd.DataFrame:
+        state["loads"] += 1
+        return sample_frame().assign(version=state["version"])
+
+    for cache in (first, second):
+        cache.register("tasks", load, version=lambda: state["version"])
+
+    first.get("tasks", "2026-10-18")
+    from_shared = second.get("tasks", "2026-10-18")
+    assert state["loads"] == 1
+    assert from_shared["version"].tolist() == [1, 1]
+
+    state["version"] = 2
+    assert second.get("tasks", "2026-10-18")["version"].tolist() == [2, 2]
+    assert first.get("tasks", "2026-10-18")["version"].tolist() == [2, 2]
+    assert state["loads"] == 2
+
+
+def compute_in_child(directory: str) -> dict:
+    return cached_result("plan", {"day": "2026-10-18"}, lambda: {"plan": ["from child"]}, backend=ArrowDiskBackend(directory))
+
+
+def test_cached_result_is_shared_across_processes(tmp_path):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        assert pool.submit(compute_in_child, str(tmp_path)).result() == {"plan": ["from child"]}
+
+    def compute() -> dict:
+        raise AssertionError("the child's result should have been reused")
+
+    assert cached_result("plan", {"day": "2026-10-18"}, compute, backend=ArrowDiskBackend(tmp_path)) == {"plan": ["from child"]}
@@ -0,0 +1,50 @@
+from datetime import date
+
+from src.application.calendar.session import CalendarSession
+from src.application.calendar.write_queue import DueDateWriteQueue
+
+
+def message(revision: int, edits: list[dict]) -> dict:
+    return {"mount": "m", "view": "Week", "anchor": "2026-10-18", "revision": revision, "edits": edits}
+
+
+def failing_write(card_id: str, due: date) -> None:
+    raise RuntimeError("Trello API error (500)")
+
+
+def test_coalesced_failure_restores_date_before_first_edit():
+    # The card is due 10-20 in the feed; both drags are merged into one write, which fails
+    queue = DueDateWriteQueue(failing_write, window=60, concurrency=2)
+    session = CalendarSession()
+    session.receive(message(0, [{"id": 1, "cardId": "c1", "due": "2026-10-21"}]), apply_edit=queue.submit)
+    session.receive(message(0, [{"id": 2, "cardId": "c1", "due": "2026-10-22"}]), apply_edit=queue.submit)
+    assert session.due_dates == {"c1": date(2026, 10, 22)}
+    assert session.acks()["queued"] == 1
+
+    assert queue.flush(timeout=5)
+    session.settle_writes()
+
+    assert "c1" not in session.due_dates  # back to the feed's 10-20, not the unsent 10-21
+    failures = [result for result in session.results if not result["ok"]]
+    assert sorted(result["id"] for result in failures) == [1, 2]
+    assert session.acks()["queued"] == 0
+
+
+def test_failure_restores_last_date_trello_accepted():
+    outcomes = iter([None, RuntimeError("Trello API error (500)")])
+
+    def write(card_id: str, due: date) -> None:
+        error = next(outcomes)
+        if error:
+            raise error
+
+    queue = DueDateWriteQueue(write, window=60, concurrency=2)
+    session = CalendarSession()
+    session.receive(message(0, [{"id": 1, "cardId": "c1", "due": "2026-10-21"}]), apply_edit=queue.submit)
+    assert queue.flush(timeout=5)
+    session.receive(message(0, [{"id": 2, "cardId": "c1", "due": "2026-10-22"}]), apply_edit=queue.submit)
+    assert queue.flush(timeout=5)
+    session.settle_writes()
+
+    assert session.due_dates == {"c1": date(2026, 10, 21)}
+    assert [(result["id"], result["ok"]) for result in session.results] == [(1, True), (2, True), (2, False)]
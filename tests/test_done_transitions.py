@@ -0,0 +1,44 @@
+import pandas as pd
+
+from src.application.data_pipeline.fetcher import DONE_LIST_NAME, first_done_moves, iter_action_pages
+
+
+def move(card_id: str, day: str, list_before: str, list_after: str = DONE_LIST_NAME) -> dict:
+    return {
+        "id": f"{card_id}-{day}",
+        "type": "updateCard",
+        "date": f"{day}T10:00:00.000Z",
+        "data": {"card": {"id": card_id}, "listBefore": {"name": list_before}, "listAfter": {"name": list_after}},
+    }
+
+
+def test_first_done_move_per_card_is_kept_across_pages():
+    # Newest first, the way Trello pages the history
+    history = [
+        move("a", "2026-10-10", "Review"),
+        move("b", "2026-10-09", "Doing"),
+        move("a", "2026-10-08", DONE_LIST_NAME, "Doing"),
+        move("a", "2026-10-05", "Doing"),
+        move("c", "2026-10-04", "Backlog", "Doing"),
+        move("b", "2026-10-02", DONE_LIST_NAME),
+        move("b", "2026-10-01", "Backlog"),
+    ]
+
+    def fetch_page(before=None, since=None, limit=2):
+        start = 0 if before is None else next(i for i, action in enumerate(history) if action["id"] == before) + 1
+        return history[start:start + limit]
+
+    first = first_done_moves(iter_action_pages(page_size=2, fetch_page=fetch_page)).set_index("card_id")
+
+    assert sorted(first.index) == ["a", "b"]
+    assert first.loc["a", "done_date"] == pd.Timestamp("2026-10-05T10:00:00Z")
+    assert first.loc["a", "origin_list"] == "Doing"
+    assert first.loc["b", "done_date"] == pd.Timestamp("2026-10-01T10:00:00Z")
+    assert first.loc["b", "origin_list"] == "Backlog"
+
+
+def test_no_pages_give_an_empty_typed_frame():
+    first = first_done_moves([])
+
+    assert first.empty
+    assert str(first["done_date"].dtype) == "datetime64[ns, UTC]"
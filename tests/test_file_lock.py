@@ -0,0 +1,43 @@
+import multiprocessing
+import os
+
+import pytest
+
+from src.infrastructure.persistence.file_lock import FileLock, LockHeldError
+
+
+def try_lock(path: str) -> str:
+    try:
+        with FileLock(path):
+            return "acquired"
+    except LockHeldError:
+        return "held"
+
+
+def hold_and_die(path: str, ready) -> None:
+    FileLock(path).acquire()
+    ready.set()
+    os._exit(1)  # no release: the OS must drop the lock
+
+
+def test_lock_excludes_other_processes(tmp_path):
+    path = str(tmp_path / "sync.lock")
+    context = multiprocessing.get_context("spawn")
+    with FileLock(path), context.Pool(1) as pool:
+        assert pool.apply(try_lock, (path,)) == "held"
+    with context.Pool(1) as pool:
+        assert pool.apply(try_lock, (path,)) == "acquired"
+
+
+def test_lock_of_a_dead_process_is_free(tmp_path):
+    path = str(tmp_path / "sync.lock")
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    holder = context.Process(target=hold_and_die, args=(path, ready))
+    holder.start()
+    assert ready.wait(30)
+    holder.join(30)
+
+    with FileLock(path):
+        with pytest.raises(LockHeldError):
+            FileLock(path).acquire()
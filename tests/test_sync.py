@@ -0,0 +1,57 @@
+import pandas as pd
+
+from src.application.data_pipeline import sync
+from src.infrastructure.persistence.task_store import TaskStore
+
+BOARD = "board"
+
+
+def card(card_id: str, list_id: str) -> dict:
+    return {
+        "id": card_id,
+        "idBoard": BOARD,
+        "idList": list_id,
+        "name": f"task {card_id}",
+        "due": None,
+        "dateLastActivity": "2026-10-01T10:00:00.000Z",
+        "closed": False,
+    }
+
+
+def stored(card_id: str, list_name: str) -> dict:
+    return {
+        "list": list_name,
+        "card": f"task {card_id}",
+        "card_id": card_id,
+        "card_due": pd.NaT,
+        "card_last_activity": pd.Timestamp("2026-10-01T10:00:00Z"),
+        "status": "Not Done",
+        "done_date": pd.NaT,
+        "origin_list": None,
+    }
+
+
+def list_action(action_type: str, list_id: str, name: str) -> dict:
+    return {"id": f"{action_type}-{list_id}", "type": action_type, "date": "2026-10-02T10:00:00.000Z",
+            "data": {"list": {"id": list_id, "name": name}}}
+
+
+def test_list_actions_resync_every_card_on_the_list(tmp_path, monkeypatch):
+    store = TaskStore(tmp_path / "tasks.db")
+    store.upsert(pd.DataFrame([stored("a", "Doing"), stored("b", "Doing"), stored("c", "Old"), stored("d", "Backlog")]))
+    board_cards = {"doing": [card("a", "doing"), card("b", "doing")], "old": [card("c", "old")]}
+
+    monkeypatch.setattr(sync, "Board_ID", BOARD)
+    monkeypatch.setattr(sync, "fetch_lists", lambda: [{"id": "doing", "name": "In Progress"}, {"id": "backlog", "name": "Backlog"}])
+    monkeypatch.setattr(sync, "iter_action_pages", lambda since, action_filter: iter([[
+        list_action("updateList", "doing", "In Progress"),
+        list_action("updateList", "old", "Old"),  # archived, so absent from the open lists
+    ]]))
+    monkeypatch.setattr(sync, "fetch_cards_by_list", lambda list_ids: [board_cards[list_id] for list_id in list_ids])
+    monkeypatch.setattr(sync, "fetch_cards_by_id", lambda card_ids: [None for _ in card_ids])
+
+    last_action_date, _ = sync.incremental_sync({"last_action_date": "2026-10-01T00:00:00Z"}, store)
+
+    lists = store.all().set_index("card_id")["list"].to_dict()
+    assert lists == {"a": "In Progress", "b": "In Progress", "d": "Backlog"}
+    assert last_action_date == "2026-10-02T10:00:00Z"
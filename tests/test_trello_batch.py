@@ -0,0 +1,78 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.infrastructure.trello import trello_client
+from src.infrastructure.trello.trello_client import BATCH_URL_LIMIT, batch_get
+
+
+class BatchHandler(BaseHTTPRequestHandler):
+    """Stand-in for Trello's /1/batch: cards named "missing-*" are 404s, a route "/fail" fails the whole call."""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        routes = parse_qs(url.query)["urls"][0].split(",")
+        with self.server.lock:
+            self.server.calls.append((url.path, routes))
+        if "/fail" in routes:
+            self._send(500, "internal error")
+            return
+        results = [
+            {"404": "could not find the card"} if "missing" in route else {"200": {"route": route}}
+            for route in routes
+        ]
+        self._send(200, results)
+
+    def _send(self, status: int, body) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def trello(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BatchHandler)
+    server.calls, server.lock = [], threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(trello_client, "API_KEY", "key")
+    monkeypatch.setattr(trello_client, "API_TOKEN", "token")
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_batch_get_chunks_routes_and_keeps_their_order(trello):
+    server, api_url = trello
+    routes = [f"/cards/card-{i}" for i in range(25)]
+
+    results = batch_get(routes, api_url=api_url)
+
+    assert len(server.calls) == -(-len(routes) // BATCH_URL_LIMIT)
+    assert all(path == "/1/batch" and len(chunk) <= BATCH_URL_LIMIT for path, chunk in server.calls)
+    assert [result["route"] for result in results] == routes
+
+
+def test_batch_get_returns_none_for_missing_items(trello):
+    _, api_url = trello
+
+    results = batch_get(["/cards/a", "/cards/missing-b", "/cards/c"], api_url=api_url)
+
+    assert results == [{"route": "/cards/a"}, None, {"route": "/cards/c"}]
+
+
+def test_batch_get_raises_when_a_whole_batch_fails(trello):
+    _, api_url = trello
+    routes = [f"/cards/card-{i}" for i in range(12)] + ["/fail"]
+
+    with pytest.raises(RuntimeError, match="500"):
+        batch_get(routes, api_url=api_url)
@@ -0,0 +1,19 @@
+from datetime import date
+
+import pandas as pd
+
+from src.application.data_pipeline.views import add_relative_columns
+
+
+def test_card_touched_today_is_zero_days_old():
+    tasks = pd.DataFrame({
+        "card_last_activity": pd.to_datetime(
+            ["2026-10-18T08:30:00Z", "2026-10-17T23:59:00Z", "2026-10-08T12:00:00Z"], utc=True
+        ),
+        "card_due": pd.to_datetime(["2026-10-18T20:59:00Z", "2026-10-20T20:59:00Z", None], utc=True),
+    })
+
+    relative = add_relative_columns(tasks, date(2026, 10, 18))
+
+    assert relative["card_age"].tolist() == [0, 1, 10]
+    assert relative["days_to_due"].iloc[:2].tolist() == [0, 2]